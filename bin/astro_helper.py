@@ -0,0 +1,112 @@
+"""
+Entry point shared by the astro helpers (astro-progressions-helper,
+astro-zr-helper).
+
+Each helper defines its COMMANDS table and hands it to `run`; the helpers
+load this module from their own directory, so it needs nothing beyond the
+standard library in either uv env.
+
+A command returns a dict, or a generator to stream its answer one item at a
+time: NDJSON on stdout for a one-shot run, one reply line per item on the
+socket of a warm helper.
+"""
+import json
+import sys
+
+
+def serve(path, commands, idle_ttl=300):
+    """Answer requests on a Unix socket until idle for `idle_ttl` seconds.
+
+    One JSON request per line in, one line out: {"ok": true, "result": ...}
+    or {"ok": false, "error": ..., "traceback": ...}. A streaming command
+    (a generator) answers {"ok": true, "item": ...} per item, then
+    {"ok": true, "end": true}. The astro script
+    starts this on demand and reuses it, so repeat queries skip uv, the
+    interpreter and the library import. The socket only appears once it is
+    listening, and is removed on exit unless a newer server took the path.
+    A client that hangs up mid-reply only loses its own connection.
+    """
+    import os
+    import socket
+    import traceback
+    import types
+
+    srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    tmp = f"{path}.{os.getpid()}"
+    srv.bind(tmp)
+    srv.listen(8)
+    os.replace(tmp, path)
+    ino = os.stat(path).st_ino
+    srv.settimeout(idle_ttl)
+    try:
+        while True:
+            try:
+                conn, _ = srv.accept()
+            except socket.timeout:
+                break
+            conn.settimeout(None)
+            try:
+                with conn, conn.makefile('rwb') as f:
+                    for line in f:
+                        try:
+                            req = json.loads(line)
+                            handler = commands.get(req.get('command'))
+                            if handler is None:
+                                raise ValueError(f"Unknown command: {req.get('command')}")
+                            result = handler(req)
+                            if isinstance(result, types.GeneratorType):
+                                for item in result:
+                                    f.write(json.dumps({'ok': True, 'item': item}).encode() + b'\n')
+                                    f.flush()
+                                reply = {'ok': True, 'end': True}
+                            else:
+                                reply = {'ok': True, 'result': result}
+                        except Exception as e:
+                            reply = {'ok': False, 'error': str(e),
+                                     'traceback': traceback.format_exc()}
+                        f.write(json.dumps(reply).encode() + b'\n')
+                        f.flush()
+            except OSError:
+                pass    # the client hung up; keep serving the next one
+    finally:
+        srv.close()
+        try:
+            if os.stat(path).st_ino == ino:
+                os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def main(commands):
+    if sys.argv[1:2] == ['--serve']:
+        import signal
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))   # so serve cleans up
+        idle_ttl = 300
+        if '--idle-ttl' in sys.argv:
+            idle_ttl = float(sys.argv[sys.argv.index('--idle-ttl') + 1])
+        serve(sys.argv[2], commands, idle_ttl)
+        return
+    req = json.load(sys.stdin)
+    cmd = req.get('command')
+    if cmd not in commands:
+        print(json.dumps({'error': f"Unknown command: {cmd}"}), file=sys.stdout)
+        sys.exit(2)
+    out = commands[cmd](req)
+    if isinstance(out, dict):
+        json.dump(out, sys.stdout)
+        return
+    for item in out:
+        print(json.dumps(item), flush=True)
+
+
+def run(commands):
+    """`main`, reporting any error as JSON on stdout with exit status 1."""
+    try:
+        main(commands)
+    except Exception as e:
+        import traceback
+        json.dump({
+            'error': str(e),
+            'traceback': traceback.format_exc(),
+        }, sys.stdout)
+        sys.exit(1)
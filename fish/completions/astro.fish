@@ -31,8 +31,14 @@ complete -c astro -f -n '__fish_use_subcommand' -a 'now' -d 'Show current transi
 complete -c astro -f -n '__fish_use_subcommand' -a 'forecast' -d 'Forecast upcoming transits'
 complete -c astro -f -n '__fish_use_subcommand' -a 'progressions' -d 'Secondary progressions (immanuel)'
 complete -c astro -f -n '__fish_use_subcommand' -a 'zr' -d 'Zodiacal Releasing (stellium)'
+complete -c astro -f -n '__fish_use_subcommand' -a 'synastry' -d 'Inter-chart aspects (--matrix: every pair)'
 complete -c astro -f -n '__fish_use_subcommand' -a 'clear-cache' -d 'Clear transit cache'
+complete -c astro -f -n '__fish_use_subcommand' -a 'build-cities' -d 'Index a GeoNames dump for offline geocoding'
+complete -c astro -f -n '__fish_use_subcommand' -a 'build-ephemeris' -d 'Precompute positions for mundane/sky'
 complete -c astro -f -n '__fish_use_subcommand' -a 'config' -d 'Show configuration'
+complete -c astro -f -n '__fish_use_subcommand' -a 'serve' -d 'Keep a warm process for fast repeat commands'
+complete -c astro -f -n '__fish_use_subcommand' -l profile -d 'Time per stage, on stderr'
+complete -c astro -r -n '__fish_use_subcommand' -l profile-json -d 'Write the stage breakdown as JSON'
 
 # Chart name completions
 complete -c astro -f -n '__astro_needs_chart' -a '(__astro_list_charts)'
@@ -43,12 +49,18 @@ complete -c astro -f -n '__fish_seen_subcommand_from forecast' -l date -d 'Start
 complete -c astro -f -n '__fish_seen_subcommand_from forecast' -s a -l all -d 'Include all objects'
 complete -c astro -f -n '__fish_seen_subcommand_from forecast' -s o -l orb -d 'Max orb in degrees'
 complete -c astro -f -n '__fish_seen_subcommand_from forecast' -l sustained-orb -d 'Sustained Aspects orb (default 2.0; 0 disables)'
+complete -c astro -f -n '__fish_seen_subcommand_from forecast' -l all-charts -d 'Aspect hits to every saved chart'
+complete -c astro -f -n '__fish_seen_subcommand_from forecast' -l format -a 'text ics ndjson' -d 'Output format'
+complete -c astro -f -n '__fish_seen_subcommand_from forecast' -l stream -d 'Write each day as it is computed'
 
 # Progressions options
 complete -c astro -f -n '__fish_seen_subcommand_from progressions' -l date -d 'Target date YYYY-MM-DD (default: today)'
 complete -c astro -f -n '__fish_seen_subcommand_from progressions' -l aspects -d 'Show progressed → natal aspects'
 complete -c astro -f -n '__fish_seen_subcommand_from progressions' -l dignities -d 'Show natal dignity scores'
 complete -c astro -f -n '__fish_seen_subcommand_from progressions' -l json -d 'JSON output'
+complete -c astro -f -n '__fish_seen_subcommand_from progressions' -l from -d 'Timeline start YYYY-MM-DD'
+complete -c astro -f -n '__fish_seen_subcommand_from progressions' -l to -d 'Timeline end YYYY-MM-DD'
+complete -c astro -f -n '__fish_seen_subcommand_from progressions' -l step -d 'Timeline step (1y, 6m, 2w, 30d)'
 
 # ZR options
 complete -c astro -f -n '__fish_seen_subcommand_from zr' -l lot -xa 'fortune spirit eros necessity courage victory nemesis' -d 'Lot to release'
@@ -57,3 +69,16 @@ complete -c astro -f -n '__fish_seen_subcommand_from zr' -l max-level -xa '1 2 3
 complete -c astro -f -n '__fish_seen_subcommand_from zr' -l age -d 'Snapshot at this age (years)'
 complete -c astro -f -n '__fish_seen_subcommand_from zr' -l lifespan -d 'Years of ZR (default 100)'
 complete -c astro -f -n '__fish_seen_subcommand_from zr' -l json -d 'JSON output'
+
+# Synastry options
+complete -c astro -f -n '__fish_seen_subcommand_from synastry' -a '(__astro_list_charts)'
+complete -c astro -f -n '__fish_seen_subcommand_from synastry' -l matrix -d 'Rank every pair of charts'
+complete -c astro -f -n '__fish_seen_subcommand_from synastry' -l json -d 'JSON output (--matrix: one pair per line)'
+complete -c astro -f -n '__fish_seen_subcommand_from synastry' -l csv -d 'Ranked pair table as CSV (--matrix)'
+
+# Build-ephemeris options
+complete -c astro -F -n '__fish_seen_subcommand_from build-cities'
+complete -c astro -f -n '__fish_seen_subcommand_from build-ephemeris' -l hourly -d 'Hourly grid (~24x larger)'
+complete -c astro -f -n '__fish_seen_subcommand_from build-ephemeris' -l start -d 'First year (default 1900)'
+complete -c astro -f -n '__fish_seen_subcommand_from build-ephemeris' -l end -d 'Last year (default 2100)'
+complete -c astro -f -n '__fish_seen_subcommand_from serve' -l idle-ttl -d 'Exit after N idle seconds (0: never)'
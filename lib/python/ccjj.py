@@ -26,16 +26,18 @@ import atexit
 import base64
 import datetime
 import fcntl
+import hashlib
 import json
 import os
 import subprocess
 import sys
 import tempfile
 import time
+import zlib
 from typing import NoReturn
 
 JJ_DEADLINE = 8          # seconds; a wedged jj must never hang the agent
-SCHEMA = 1
+SCHEMA = 2               # 2: full-file texts live in the blob store
 ROOT = ""                # repo root, set once in main() before any subcommand
 
 
@@ -350,6 +352,56 @@ def session_is_live(jdir):
     return owner_alive(jdir) and journal_age_hours(jdir) < STALE_HOURS
 
 
+# ------------------------------------------------------------------ blob store
+#
+# An Edit record carries the file's full pre-edit text, and a Write its full new
+# text. Inline, editing one 5,000-line file 50 times stored it 50 times, and
+# every reader of the journal -- survey() on each audit and nudge -- parsed all
+# of it to get at the paths. Records now name those texts by sha256, and each
+# distinct text is stored once, zlib-compressed, under the session's own
+# blobs/ directory. It lives inside the journal directory, so retire() and prune
+# move and delete it together with the records that name it.
+
+BLOBS = "blobs"
+
+
+def put_blob(jdir, data):
+    """Store `data` once under jdir/blobs/; returns its sha256 hex digest."""
+    h = hashlib.sha256(data).hexdigest()
+    d = os.path.join(jdir, BLOBS)
+    dest = os.path.join(d, h + ".z")
+    if os.path.exists(dest):
+        return h
+    os.makedirs(d, mode=0o700, exist_ok=True)
+    # Written aside and renamed in: concurrent hooks (subagents share the
+    # session) store the same text, and a reader must never see half a blob.
+    fd, tmp = tempfile.mkstemp(dir=d, prefix=".tmp-")
+    with os.fdopen(fd, "wb") as fh:
+        fh.write(zlib.compress(data))
+    os.replace(tmp, dest)
+    return h
+
+
+def get_blob(jdir, h):
+    """The bytes put_blob stored as `h`.
+
+    Checked against the hash: a damaged blob replayed as an edit's pre-edit text
+    would misplace the edit, or merge a Write against the wrong base, with the
+    byte verification passing.
+    """
+    fp = os.path.join(jdir, BLOBS, h + ".z")
+    try:
+        with open(fp, "rb") as fh:
+            data = zlib.decompress(fh.read())
+    except (OSError, zlib.error) as e:
+        die("journal blob %s is unreadable (%s).\n"
+            "  Remove the records that name it, then re-run." % (fp, e))
+    if hashlib.sha256(data).hexdigest() != h:
+        die("journal blob %s is damaged (its content does not match its name).\n"
+            "  Remove the records that name it, then re-run." % fp)
+    return data
+
+
 # ------------------------------------------------------------- record-edit hook
 
 def cmd_record_edit(_args):
@@ -402,6 +454,16 @@ def cmd_record_edit(_args):
     os.makedirs(d, mode=0o700, exist_ok=True)
     stamp_owner(d)
     stamp_base(d, root)
+    for key in ("original", "content"):
+        text = record[key]
+        if text is None:
+            continue
+        try:
+            data = text.encode("utf-8", "surrogateescape")
+        except UnicodeEncodeError:
+            continue        # not representable as bytes; stays inline, as before
+        record[key + "_blob"] = put_blob(d, data)
+        del record[key]
     # One file per record, O_EXCL. Appending to a shared .jsonl interleaved
     # under concurrent hooks: order was scrambled and a 64KB Write produced
     # unparseable JSON.
@@ -668,10 +730,17 @@ def load_records(jdir):
         fp = os.path.join(jdir, name)
         try:
             with open(fp) as fh:
-                out.append(json.load(fh))
+                rec = json.load(fh)
         except (json.JSONDecodeError, OSError) as e:
             die("journal record %s is unreadable (%s).\n"
                 "  Inspect or remove it, then re-run." % (fp, e))
+        if rec.get("schema", 1) > SCHEMA:
+            # Read as an older record, its texts would look absent: a Write
+            # would replay as an empty file.
+            die("journal record %s was written by a newer ccjj (schema %s).\n"
+                "  Update ccjj, then re-run." % (fp, rec.get("schema")))
+        rec["_jdir"] = jdir     # where its *_blob texts are (see blob())
+        out.append(rec)
     return out
 
 
@@ -793,10 +862,15 @@ def merge3(current, base, ours, path, label):
 def blob(rec, key):
     """A record field as bytes.
 
-    Claimed Bash windows are stored base64 because their content comes off disk
-    rather than out of a JSON tool payload, so it need not be UTF-8 -- a build
-    artifact or a CRLF file would otherwise be unrepresentable.
+    Hook records name their texts by hash (`<key>_blob`, see put_blob); older
+    ones carry them inline. Claimed Bash windows are stored base64 because their
+    content comes off disk rather than out of a JSON tool payload, so it need
+    not be UTF-8 -- a build artifact or a CRLF file would otherwise be
+    unrepresentable.
     """
+    h = rec.get(key + "_blob")
+    if h:
+        return get_blob(rec["_jdir"], h)
     v = rec.get(key)
     if v is None:
         return None
@@ -808,8 +882,93 @@ def blob(rec, key):
     return v.encode("utf-8", "surrogateescape")
 
 
-def build(records, present, pinned):
-    """Reconstruct, per path, '@- plus exactly this session's edits'."""
+def git_store():
+    """The git object store behind this repo's jj store, or None.
+
+    jj's git backend writes every commit it makes into that store under the
+    same id, so git can read any revision's blobs directly. A secondary
+    workspace's .jj/repo is a file naming the main repo's.
+    """
+    repo = os.path.join(ROOT, ".jj", "repo")
+    try:
+        if os.path.isfile(repo):
+            with open(repo) as fh:
+                repo = os.path.join(ROOT, ".jj", fh.read().strip())
+        store = os.path.join(repo, "store")
+        with open(os.path.join(store, "type")) as fh:
+            if fh.read().strip() != "git":
+                return None
+        with open(os.path.join(store, "git_target")) as fh:
+            return os.path.normpath(os.path.join(store, fh.read().strip()))
+    except OSError:
+        return None
+
+
+def git_batch(store, *args, stdin=None):
+    """Run git against `store`, or None if git could not run at all."""
+    try:
+        return subprocess.run(["git", "--git-dir=" + store, "--literal-pathspecs", *args],
+                              input=stdin, capture_output=True, timeout=JJ_DEADLINE)
+    except subprocess.TimeoutExpired:
+        die("git %s exceeded %ds" % (args[0], JJ_DEADLINE), 4)
+    except OSError:
+        return None
+
+
+def read_blobs(commit, paths):
+    """{path: bytes} at `commit` (an id, not a revset), each exactly what
+    `jj file show` prints for it: b"" for an absent path, a symlink or a
+    submodule.
+
+    A commit used to read every path three times -- build, the --diff preview,
+    the post-commit verify -- at one ~40ms `jj file show` each, so a 40-file
+    session spawned 120+ jj processes. This is two git processes for any number
+    of paths: `ls-tree` for the entries, `cat-file --batch` for their blobs. A
+    path git cannot resolve -- no git backend, or a conflicted commit, whose git
+    tree is jj's own encoding rather than the files -- falls back to
+    `jj file show` for that path alone, so the answer is the same either way.
+    """
+    paths = sorted(set(paths))
+    out = {}
+    store = git_store() if paths else None
+    oids = {}
+    lt = git_batch(store, "ls-tree", "-z", "--full-tree", commit, "--", *paths) if store else None
+    if lt is not None and lt.returncode == 0:
+        want = set(paths)
+        for entry in lt.stdout.split(b"\0"):
+            meta, _, raw = entry.partition(b"\t")
+            path = raw.decode("utf-8", "surrogateescape")
+            if path not in want:
+                continue        # ls-tree also lists what is under a named directory
+            mode, _, oid = meta.decode().split(" ")
+            if mode in ("100644", "100755"):
+                oids[path] = oid
+            else:
+                out[path] = b""
+    if oids:
+        cf = git_batch(store, "cat-file", "--batch",
+                       stdin="".join(oid + "\n" for oid in oids.values()).encode())
+        data, pos = (cf.stdout, 0) if cf is not None and cf.returncode == 0 else (b"", 0)
+        for path in oids:
+            # "<oid> blob <size>\n<content>\n" per request, in request order
+            eol = data.find(b"\n", pos)
+            header = data[pos:eol].split(b" ") if eol >= 0 else []
+            if len(header) != 3 or header[1] != b"blob":
+                break
+            start = eol + 1
+            out[path] = data[start:start + int(header[2])]
+            pos = start + int(header[2]) + 1
+    for path in paths:
+        if path not in out:
+            r = jj("file", "show", "-r", commit, fs(path), "--ignore-working-copy", check=False)
+            out[path] = r.stdout if r.returncode == 0 else b""
+    return out
+
+
+def build(records, base, pinned):
+    """Reconstruct, per path, '@- plus exactly this session's edits'.
+
+    `base` holds @-'s content for the paths it has (see read_blobs)."""
     by_path = {}
     for rec in records:
         if rec.get("path"):
@@ -817,7 +976,7 @@ def build(records, present, pinned):
 
     mine = {}
     for path, recs in by_path.items():
-        content = jj("file", "show", "-r", "@-", fs(path)).stdout if path in present else b""
+        content = base.get(path, b"")
 
         for rec in recs:
             original = blob(rec, "original")
@@ -995,7 +1154,10 @@ def cmd_commit(args):
                     pass
             scoped.append(r)
 
-        mine = build(scoped, present, pinned)
+        # @-'s side of every path, read once and shared by the reconstruction
+        # and the --diff preview
+        base = read_blobs(pinned, {rel(r["path"]) for r in scoped if r.get("path")} & present)
+        mine = build(scoped, base, pinned)
         if not mine and not also:
             die("nothing to commit", 2)
 
@@ -1038,11 +1200,10 @@ def cmd_commit(args):
 
         if args.diff:
             for path in sorted(mine):
-                base = jj("file", "show", "-r", "@-", fs(path)).stdout if path in present else b""
                 with tempfile.TemporaryDirectory(prefix="ccjj-diff-") as d:
                     a, b = os.path.join(d, "a"), os.path.join(d, "b")
                     with open(a, "wb") as fh:
-                        fh.write(base)
+                        fh.write(base.get(path, b""))
                     with open(b, "wb") as fh:
                         fh.write(mine[path])
                     subprocess.run(["diff", "-u", "--label", "a/" + path,
@@ -1143,8 +1304,9 @@ def cmd_commit(args):
             # it discards the payload, makes an empty commit and reports success.
             # Without this the journal would then be consumed and the work
             # rendered unattributable.
-            bad = [p for p, want in mine.items()
-                   if jj("file", "show", "-r", "@-", fs(p), check=False).stdout != want]
+            ids, _ = parent_ids()
+            got = read_blobs(ids[0], mine) if ids and len(ids) == 1 else {}
+            bad = [p for p, want in mine.items() if got.get(p) != want]
             if bad:
                 rollback(before_op)
                 die("the commit did not take for: %s\n"
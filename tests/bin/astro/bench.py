@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Benchmarks for bin/astro's calculators.
+
+Times a fixed set of calculations against fixed reference charts and
+dates, so numbers are comparable between runs and commits:
+
+    python tests/bin/astro/bench.py               # run and print
+    python tests/bin/astro/bench.py --save        # ...and record as the baseline
+    python tests/bin/astro/bench.py --compare     # ...and flag regressions
+    python tests/bin/astro/bench.py -k forecast   # only names containing "forecast"
+    python tests/bin/astro/bench.py --profile     # ...with astro's per-stage breakdown
+
+Each benchmark's setup (fresh storage, so transit/eclipse/ZR caches start
+empty) runs untimed before every repetition; the best repetition is the
+figure recorded. Natal contexts stay warm across repetitions, as they do
+within one astro run. Baselines are per machine, in ~/.local/state/astro/
+by default. --compare exits 1 if any benchmark got slower than the
+baseline by more than --threshold. test_bench.py runs a cheap subset.
+"""
+
+import argparse
+import importlib.machinery
+import importlib.util
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+ASTRO = Path(__file__).resolve().parents[3] / "bin" / "astro"
+DEFAULT_BASELINE = Path.home() / ".local" / "state" / "astro" / f"bench-{platform.node()}.json"
+
+START = datetime(2026, 1, 1)
+PRAGUE = (50.0755, 14.4378)
+
+# name -> BirthData fields after full_name (with coordinates: no geocoding)
+CHARTS = {
+    'provo': (1993, 10, 20, 16, 14, 'Provo', 'US', 40.2338, -111.6585, 'America/Denver'),
+    'paris': (1990, 3, 2, 8, 5, 'Paris', 'FR', 48.8566, 2.3522, 'Europe/Paris'),
+    'sydney': (1975, 7, 14, 22, 30, 'Sydney', 'AU', -33.8688, 151.2093, 'Australia/Sydney'),
+}
+
+
+def load_astro():
+    warnings.filterwarnings('ignore', category=DeprecationWarning)
+    loader = importlib.machinery.SourceFileLoader("astro", str(ASTRO))
+    spec = importlib.util.spec_from_file_location("astro", ASTRO, loader=loader)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules["astro"] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class Unavailable(Exception):
+    """A benchmark that can't run here (e.g. a helper's uv env is missing)."""
+
+
+def benchmarks(astro, scratch: Path):
+    """[(name, setup)]: setup() returns the callable to time."""
+    charts = {name: astro.NatalChart(name, astro.BirthData(name, *fields),
+                                     '2026-01-01T00:00:00')
+              for name, fields in CHARTS.items()}
+    fresh = iter(range(10 ** 9))
+
+    def calc():
+        storage = astro.AstroStorage(base_path=scratch / f"s{next(fresh)}")
+        return astro.TransitCalculator(storage)
+
+    out = []
+    for cname, chart in charts.items():
+        out += [
+            (f"forecast_transits[{cname},30d]",
+             lambda chart=chart: lambda c=calc(): c.forecast_transits(
+                 chart, 30, start_date=START)),
+            (f"forecast_transits[{cname},365d]",
+             lambda chart=chart: lambda c=calc(): c.forecast_transits(
+                 chart, 365, start_date=START)),
+            (f"sustained_aspects[{cname},365d]",
+             lambda chart=chart: lambda c=calc(): c.sustained_aspects(
+                 chart, 365, start_date=START)),
+            (f"lines_near[{cname},prague]",
+             lambda chart=chart: lambda c=calc(): astro.AspectLineCalculator(
+                 c, astro.RelocationCalculator(c.storage, c)).lines_near(chart, *PRAGUE)),
+            (f"parans_near[{cname},prague]",
+             lambda chart=chart: lambda c=calc(): astro.ParanCalculator(c).parans_near(
+                 chart, PRAGUE[0])),
+        ]
+
+    provo = charts['provo']
+    out += [
+        ("track_planet[moon,1y]",
+         lambda: lambda c=calc(): c.track_planet(
+             provo, 'moon', START, datetime(2027, 1, 1))),
+        ("track_planet[pluto,100y]",
+         lambda: lambda c=calc(): c.track_planet(
+             provo, 'pluto', datetime(2000, 1, 1), datetime(2100, 1, 1))),
+        ("eclipses_in_range[10y]",
+         lambda: lambda c=calc(): astro.EclipseCalculator(
+             c, astro.RelocationCalculator(c.storage, c)).eclipses_in_range(
+                 2461041.5, 10)),
+        ("find_sr_jd[x50]", lambda: _solar_returns(astro, calc(), provo)),
+        ("helper[progressions]", lambda: _helper_call(
+            lambda: lambda c=calc(): astro.ProgressionCalculator(c.storage).progressed_planets(
+                provo, START))),
+        ("helper[zr periods]", lambda: _helper_call(
+            lambda: lambda c=calc(): astro.ZRCalculator(c.storage).periods(provo, 'fortune'))),
+    ]
+    return out
+
+
+def _solar_returns(astro, calc, chart):
+    ctx = calc.natal_context(chart)
+    sun = dict(zip(ctx.point_names, ctx.lons.tolist()))['Sun']
+    find = astro.SolarReturnCalculator.find_sr_jd
+    return lambda: [find(ctx.jd, sun, k) for k in range(1, 51)]
+
+
+def _helper_call(make_run):
+    """A helper round trip, timed with the helper already warm. make_run()
+    returns a call on fresh storage, so the ZR cache doesn't answer it."""
+    try:
+        make_run()()
+    except (RuntimeError, OSError) as e:
+        raise Unavailable(str(e).splitlines()[0][:80])
+    return make_run()
+
+
+def measure(setup, repeat: int, astro=None) -> dict:
+    """Time `repeat` runs. Given the astro module, each run is profiled
+    (as with `astro --profile`) and the best run's stages are kept."""
+    times, stages = [], None
+    for _ in range(repeat):
+        run = setup()
+        prof = None
+        if astro is not None:
+            prof = astro._PROFILE = astro._Profile()
+        t0 = time.perf_counter()
+        try:
+            run()
+        finally:
+            elapsed = time.perf_counter() - t0
+            if prof is not None:
+                astro._PROFILE = None
+                prof.close()
+        if prof is not None and elapsed < min(times, default=float('inf')):
+            stages = prof.report(None)['stages']
+        times.append(elapsed)
+    r = {'best': min(times), 'median': statistics.median(times), 'runs': len(times)}
+    if stages is not None:
+        r['stages'] = stages
+    return r
+
+
+def stage_summary(r: dict, top: int = 4) -> str:
+    """The stages with the most self time, as shares of the best run."""
+    stages = sorted(r['stages'].items(), key=lambda kv: -kv[1]['self_ms'])[:top]
+    return "  ".join(f"{name} {s['self_ms'] / (r['best'] * 1e3):.0%}"
+                     for name, s in stages)
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Names of benchmarks slower than baseline by more than `threshold`."""
+    return [name for name, r in results.items()
+            if name in baseline and r['best'] > baseline[name]['best'] * (1 + threshold)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-k', dest='match', help='Only benchmarks whose name contains this')
+    parser.add_argument('--repeat', type=int, default=3, help='Repetitions (default 3)')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE,
+                        help=f'Baseline file (default {DEFAULT_BASELINE})')
+    parser.add_argument('--save', action='store_true', help='Record results as the baseline')
+    parser.add_argument('--compare', action='store_true', help='Compare against the baseline')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Slowdown that counts as a regression (default 0.2 = 20%%)')
+    parser.add_argument('--profile', action='store_true',
+                        help='Break each benchmark down by stage (see astro --profile)')
+    args = parser.parse_args()
+
+    astro = load_astro()
+    baseline = {}
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"Error: no baseline at {args.baseline}; run with --save first",
+                  file=sys.stderr)
+            sys.exit(1)
+        baseline = json.loads(args.baseline.read_text())['results']
+
+    results = {}
+    with tempfile.TemporaryDirectory() as scratch:
+        for name, setup in benchmarks(astro, Path(scratch)):
+            if args.match and args.match not in name:
+                continue
+            try:
+                r = measure(setup, args.repeat, astro if args.profile else None)
+            except Unavailable as e:
+                print(f"{name:36s}  skipped: {e}")
+                continue
+            results[name] = r
+            line = f"{name:36s} {r['best'] * 1e3:10.1f} ms  (median {r['median'] * 1e3:.1f})"
+            if name in baseline:
+                line += f"  {r['best'] / baseline[name]['best']:5.2f}x baseline"
+            print(line, flush=True)
+            if 'stages' in r:
+                print(f"{'':36s}   {stage_summary(r)}", flush=True)
+
+    if args.save:
+        # -k saves only what ran; other benchmarks keep their baseline
+        saved = {}
+        if args.baseline.exists():
+            saved = json.loads(args.baseline.read_text())['results']
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps({
+            'recorded': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'results': {**saved, **results},
+        }, indent=2))
+        print(f"Saved baseline: {args.baseline}")
+    if args.compare:
+        slower = compare(results, baseline, args.threshold)
+        if slower:
+            print(f"Regressions (> {args.threshold:.0%} slower): {', '.join(slower)}")
+            sys.exit(1)
+        print(f"No regressions over {args.threshold:.0%}.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Tests for `forecast --all-charts` and its SensitivePointIndex.
+
+The multi-chart sweep answers "which charts does anything hit" from one pass
+over the sky per timezone. Its aspect hits must be exactly the aspect lines
+the per-chart `forecast` prints for each chart.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def charts(astro_module, birth_data):
+    second = astro_module.BirthData(
+        full_name="second", year=1988, month=2, day=29, hour=3, minute=40,
+        city="London", nation="GB", lat=51.5074, lng=-0.1278, tz_str="Europe/London",
+    )
+    third = astro_module.BirthData(
+        full_name="third", year=2001, month=7, day=4, hour=22, minute=5,
+        city="Ogden", nation="US", lat=41.223, lng=-111.9738, tz_str="America/Denver",
+    )
+    return [
+        astro_module.NatalChart(name=bd.full_name + "_all", birth_data=bd,
+                                created_at="2026-01-01T00:00:00")
+        for bd in (birth_data, second, third)
+    ]
+
+
+class TestSensitivePointIndex:
+
+    def test_query_matches_brute_force(self, astro_module):
+        rng = np.random.default_rng(7)
+        natal = rng.uniform(0, 360, 40)
+        # Points right at the 0° Aries seam exercise the ring wrap
+        natal[:3] = [0.05, 359.95, 180.0]
+        index = astro_module.SensitivePointIndex(
+            ((0, j, lon) for j, lon in enumerate(natal)), orb_limit=2.0)
+        lons = np.concatenate([rng.uniform(0, 360, 500), [359.99, 0.0, 1.9]])
+        q, e, orb = index.query(lons)
+        got = sorted(zip(q.tolist(), index.point[e].tolist(), index.aspect[e].tolist()))
+
+        hits = astro_module._aspect_hits(lons, natal)
+        max_orb = np.array([min(2.0, o) for _, _, o in astro_module._KERYKEION_ASPECTS])
+        hits = hits[np.abs(hits['orb']) <= max_orb[hits['aspect']]]
+        want = sorted(zip(hits['a'].tolist(), hits['b'].tolist(), hits['aspect'].tolist()))
+        assert got == want
+
+
+class TestForecastAllCharts:
+
+    @pytest.mark.parametrize("major_only", [True, False])
+    def test_matches_per_chart_forecast(self, astro_module, transit_calc, charts, major_only):
+        start = datetime(2026, 2, 1)
+        sweep = transit_calc.forecast_all_charts(charts, 45, orb_limit=0.5,
+                                                 major_only=major_only, start_date=start)
+        got = {(d, name, e.transit_planet, e.natal_planet, e.aspect, round(e.orb, 9),
+                e.transit_sign, e.transit_house, e.natal_sign, e.natal_house,
+                e.applying, e.exact_date)
+               for d, hits in sweep for name, e in hits}
+        assert got
+
+        want = set()
+        skip = astro_module.TransitFormatter.POSITION_EVENT_ASPECTS
+        for chart in charts:
+            for d, events in transit_calc.forecast_transits(
+                    chart, 45, orb_limit=0.5, major_only=major_only, start_date=start):
+                for e in events:
+                    if (e.aspect in skip or e.transit_planet in ('New Moon', 'Full Moon')
+                            or e.transit_planet in astro_module.EphemerisTable.ANGLES):
+                        continue
+                    want.add((d, chart.name, e.transit_planet, e.natal_planet, e.aspect,
+                              round(e.orb, 9), e.transit_sign, e.transit_house,
+                              e.natal_sign, e.natal_house, e.applying, e.exact_date))
+        assert got == want
+
+    def test_output_groups_by_chart_then_orb(self, transit_calc, charts):
+        sweep = transit_calc.forecast_all_charts(charts, 30, start_date=datetime(2026, 2, 1))
+        order = {c.name: i for i, c in enumerate(charts)}
+        for _, hits in sweep:
+            keys = [(order[name], abs(e.orb)) for name, e in hits]
+            assert keys == sorted(keys)
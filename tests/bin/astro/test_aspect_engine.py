@@ -0,0 +1,120 @@
+"""Tests for the shared aspect engine (`_aspect_hits`).
+
+Transit, mundane, synastry and relocated-angle aspects all come from one
+vectorized separation matrix. Each caller must still report what its
+scalar / kerykeion counterpart would: same pairs, aspects and orbs.
+"""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+PTOLEMAIC = (('conjunction', 0), ('opposition', 180), ('trine', 120),
+             ('square', 90), ('sextile', 60))
+
+
+def _mundane_reference(names, lons, orb_settings):
+    """Pairwise aspects with a scalar loop, as (p1, p2, aspect, signed orb)."""
+    out = []
+    for i in range(len(names)):
+        for j in range(i + 1, len(names)):
+            diff = abs(lons[i] - lons[j])
+            if diff > 180:
+                diff = 360 - diff
+            for name, angle in PTOLEMAIC:
+                if abs(diff - angle) <= orb_settings.get(name, 6):
+                    out.append((names[i], names[j], name, diff - angle))
+    return out
+
+
+class TestAspectHits:
+
+    def test_rows_with_their_own_targets(self, astro_module):
+        rng = np.random.default_rng(3)
+        a = rng.uniform(0, 360, (6, 9))
+        b = rng.uniform(0, 360, (6, 7))
+        hits = astro_module._aspect_hits(a, b)
+        for r in range(6):
+            one = astro_module._aspect_hits(a[r], b[r])
+            mine = hits[hits['row'] == r]
+            assert mine[['a', 'b', 'aspect']].tolist() == one[['a', 'b', 'aspect']].tolist()
+            np.testing.assert_array_equal(mine['orb'], one['orb'])
+
+    def test_orb_is_signed_separation_minus_angle(self, astro_module):
+        aspects = astro_module.aspect_orbs({'trine': 8})
+        hits = astro_module._aspect_hits([10.0, 0.0], [127.0, 355.0], aspects)
+        got = {(int(h['a']), int(h['b'])): (aspects[h['aspect']][0], float(h['orb']))
+               for h in hits}
+        assert got[(0, 0)] == ('trine', pytest.approx(-3.0))
+        assert got[(1, 1)] == ('conjunction', pytest.approx(5.0))
+        # 7° past a trine: in orb only because trine is configured at 8°
+        assert got[(1, 0)] == ('trine', pytest.approx(7.0))
+
+
+class TestMundane:
+
+    @pytest.mark.parametrize("orb_settings", [
+        None,                                            # Config defaults
+        {'conjunction': 10, 'square': 2, 'trine': 1},    # sextile/opposition at 6°
+    ])
+    def test_matches_scalar_loop(self, astro_module, transit_calc, orb_settings):
+        calc = transit_calc
+        if orb_settings is not None:
+            calc = astro_module.TransitCalculator(transit_calc.storage)
+            calc.config.orb_settings = orb_settings
+        days = [date(2026, 1, 1 + k) for k in range(0, 28, 3)]
+        table = calc._sky_table(days)
+        got = calc._table_mundane(table, range(len(days)))
+        names = calc.MUNDANE_PLANETS
+        for i in range(len(days)):
+            lons = [float(table.lon[i, table.column(n)]) for n in names]
+            ref = _mundane_reference(names, lons, calc.config.orb_settings)
+            events = got[i]
+            assert sorted((e.transit_planet, e.natal_planet, e.aspect) for e in events) == \
+                sorted(r[:3] for r in ref)
+            ref_orbs = {r[:3]: r[3] for r in ref}
+            for e in events:
+                assert e.orb == pytest.approx(ref_orbs[(e.transit_planet, e.natal_planet,
+                                                        e.aspect)], abs=1e-9)
+                assert e.applying == (e.orb < 0)
+
+
+class TestSynastry:
+
+    def test_inter_aspects_match_kerykeion(self, astro_module, transit_calc, birth_data):
+        from kerykeion import SynastryAspects
+        other = astro_module.BirthData('b', 1990, 3, 2, 8, 5, 'Paris', 'FR',
+                                       48.85, 2.35, 'Europe/Paris')
+        chart_a = astro_module.NatalChart('syn_a', birth_data, '2026-01-01T00:00:00')
+        chart_b = astro_module.NatalChart('syn_b', other, '2026-01-01T00:00:00')
+        got = astro_module.SynastryCalculator(transit_calc).compute(chart_a, chart_b)
+
+        raw = SynastryAspects(transit_calc.natal_context(chart_a).subject,
+                              transit_calc.natal_context(chart_b).subject).relevant_aspects
+        want = sorted(((a['p1_name'], a['p2_name'], a['aspect'], a['orbit']) for a in raw),
+                      key=lambda a: abs(a[3]))
+        assert [(a['p1_name'], a['p2_name'], a['aspect'], a['orbit'])
+                for a in got['inter_aspects']] == want
+
+    def test_matrix_rows_match_compute(self, astro_module, transit_calc, birth_data):
+        bd = astro_module.BirthData
+        charts = [
+            astro_module.NatalChart('mx_a', birth_data, '2026-01-01T00:00:00'),
+            astro_module.NatalChart('mx_b', bd('b', 1990, 3, 2, 8, 5, 'Paris', 'FR',
+                                               48.85, 2.35, 'Europe/Paris'), ''),
+            astro_module.NatalChart('mx_c', bd('c', 1975, 7, 14, 22, 30, 'Sydney', 'AU',
+                                               -33.87, 151.21, 'Australia/Sydney'), ''),
+            astro_module.NatalChart('mx_a2', birth_data, ''),    # same birth as mx_a
+        ]
+        syn = astro_module.SynastryCalculator(transit_calc)
+        rows = syn.matrix(charts)
+        assert len(rows) == 5          # 6 pairs, minus mx_a ↔ mx_a2
+        assert [r['score'] for r in rows] == sorted((r['score'] for r in rows), reverse=True)
+        orbs = {name: orb for name, _angle, orb in astro_module._KERYKEION_ASPECTS}
+        by_name = {c.name: c for c in charts}
+        for r in rows:
+            want = syn.compute(by_name[r['chart_a']], by_name[r['chart_b']])['inter_aspects']
+            assert r['inter_aspects'] == want
+            assert r['score'] == pytest.approx(
+                sum(1 - a['orbit'] / orbs[a['aspect']] for a in want), abs=1e-3)
@@ -16,6 +16,9 @@ MC/IC distances are exact (meridian lines); AS/DC distances are locally-linear
 approximations and get a wider tolerance band.
 """
 
+import numpy as np
+import pytest
+
 # =============================================================================
 # Reference reproductions (astro.com → AspectLineCalculator)
 # =============================================================================
@@ -195,3 +198,36 @@ class TestAspectLineMath:
         rows = acalc.lines_near(chart, 40.4667, 17.2667, max_orb=5.0)
         orbs = [r['orb_deg'] for r in rows]
         assert orbs == sorted(orbs)
+
+
+# =============================================================================
+# Grid mode (`relocate lines-map`)
+# =============================================================================
+
+class TestLinesMap:
+    """lines_map is lines_near vectorized over locations."""
+
+    def test_matches_lines_near(self, astro_module, transit_calc, birth_data):
+        chart = astro_module.NatalChart(
+            name="anthony_lines_map", birth_data=birth_data,
+            created_at="2026-01-01T00:00:00",
+        )
+        acalc = astro_module.AspectLineCalculator(
+            transit_calc, astro_module.RelocationCalculator(transit_calc.storage, transit_calc))
+        # Reference cities, the southern hemisphere, and latitudes where some
+        # AS/DC lines are circumpolar (no row in lines_near)
+        lats = [40.4667, 21.3667, -33.87, 0.0, 66.5, 72.0, -55.0]
+        lngs = [17.2667, -157.8667, 151.21, -78.5, 25.7, -40.0, -68.3]
+        columns = acalc.map_columns(chart)
+        blocks = list(acalc.lines_map(chart, lats, lngs))
+        km = np.vstack([b for _, b in blocks])
+        assert km.shape == (len(lats), len(columns))
+
+        for i, (lat, lng) in enumerate(zip(lats, lngs)):
+            rows = {r['label']: r['km']
+                    for r in acalc.lines_near(chart, lat, lng, max_orb=1e9)}
+            for j, col in enumerate(columns):
+                if col['label'] in rows:
+                    assert km[i, j] == pytest.approx(rows[col['label']], abs=1e-6), col
+                else:
+                    assert np.isnan(km[i, j]), col
@@ -0,0 +1,32 @@
+"""Smoke tests for the benchmark suite (tests/bin/astro/bench.py).
+
+The suite itself is run by hand; these only check that a cheap benchmark
+records a baseline and that --compare flags a slowdown.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+BENCH = Path(__file__).parent / "bench.py"
+
+
+def _bench(*args):
+    return subprocess.run([sys.executable, str(BENCH), '-k', 'find_sr', '--repeat', '1',
+                           *args], capture_output=True, text=True)
+
+
+def test_save_then_compare(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    proc = _bench('--save', '--baseline', str(baseline))
+    assert proc.returncode == 0, proc.stderr
+    saved = json.loads(baseline.read_text())['results']
+    assert list(saved) == ['find_sr_jd[x50]'] and saved['find_sr_jd[x50]']['best'] > 0
+
+    # A baseline 1000x faster than reality is a regression
+    saved['find_sr_jd[x50]']['best'] /= 1000
+    baseline.write_text(json.dumps({'results': saved}))
+    proc = _bench('--compare', '--baseline', str(baseline))
+    assert proc.returncode == 1
+    assert 'Regressions' in proc.stdout and 'find_sr_jd[x50]' in proc.stdout
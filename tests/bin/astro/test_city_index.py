@@ -0,0 +1,83 @@
+"""Tests for CityIndex (`astro build-cities`), the offline geocoder.
+
+Charts without coordinates resolve city + nation from a sorted index built
+from a GeoNames dump instead of kerykeion's online geonames lookup.
+"""
+
+import pytest
+
+
+def _row(geonameid, name, ascii_name, lat, lng, cc, population, tz):
+    fields = [str(geonameid), name, ascii_name, '', str(lat), str(lng), 'P', 'PPL',
+              cc, '', '', '', '', '', str(population), '', '', tz, '2024-01-01']
+    return "\t".join(fields) + "\n"
+
+
+DUMP = "".join([
+    _row(1, 'Provo', 'Provo', 40.23384, -111.65853, 'US', 115919, 'America/Denver'),
+    _row(2, 'Springfield', 'Springfield', 39.80172, -89.64371, 'US', 114394, 'America/Chicago'),
+    _row(3, 'Springfield', 'Springfield', 37.21533, -93.29824, 'US', 169176, 'America/Chicago'),
+    _row(4, 'São Paulo', 'Sao Paulo', -23.5475, -46.63611, 'BR', 10021295, 'America/Sao_Paulo'),
+    _row(5, 'London', 'London', 51.50853, -0.12574, 'GB', 8961989, 'Europe/London'),
+    _row(6, 'London', 'London', 42.98339, -81.23304, 'CA', 346765, 'America/Toronto'),
+    _row(7, 'Nowhere', 'Nowhere', 0.0, 0.0, 'XX', 10, ''),   # no timezone: skipped
+])
+
+
+@pytest.fixture
+def index(astro_module, tmp_path):
+    dump = tmp_path / "cities500.txt"
+    dump.write_text(DUMP, encoding='utf-8')
+    path = tmp_path / "cities.tsv"
+    assert astro_module.CityIndex.build(str(dump), path) == 6
+    return astro_module.CityIndex(path)
+
+
+class TestCityIndex:
+
+    def test_lookup(self, index):
+        assert index.lookup('Provo', 'US') == (40.23384, -111.65853, 'America/Denver')
+        assert index.lookup('London', 'GB')[2] == 'Europe/London'
+        assert index.lookup('London', 'CA')[2] == 'America/Toronto'
+
+    def test_spellings(self, index):
+        want = (-23.5475, -46.63611, 'America/Sao_Paulo')
+        assert index.lookup('São Paulo', 'BR') == want
+        assert index.lookup('  sao   PAULO ', 'br') == want
+        assert index.lookup('london', 'UK')[2] == 'Europe/London'
+
+    def test_most_populous_wins(self, index):
+        assert index.lookup('Springfield', 'US')[:2] == (37.21533, -93.29824)
+
+    def test_misses(self, index):
+        assert index.lookup('Provo', 'CA') is None
+        assert index.lookup('Prov', 'US') is None
+        assert index.lookup('Nowhere', 'XX') is None
+        assert index.lookup('Zzyzx', 'US') is None
+        assert index.lookup('', 'US') is None
+
+    def test_bad_dump(self, astro_module, tmp_path):
+        dump = tmp_path / "cities.txt"
+        dump.write_text("Prague\t50.0755\t14.4378\n")
+        with pytest.raises(ValueError, match=':1:'):
+            astro_module.CityIndex.build(str(dump), tmp_path / "cities.tsv")
+
+
+class TestSubjectsWithoutNetwork:
+
+    def test_make_subject_uses_index(self, astro_module, index, tmp_path, monkeypatch):
+        storage = astro_module.AstroStorage(base_path=tmp_path / "astro")
+        index.path.replace(storage.cities_file)
+        calc = astro_module.TransitCalculator(storage)
+        bd = astro_module.BirthData('x', 1993, 10, 20, 16, 14, 'Provo', 'US')
+
+        import kerykeion
+        real = kerykeion.AstrologicalSubject
+
+        def no_geonames(*args, **kwargs):
+            assert kwargs.get('tz_str') == 'America/Denver', 'used online geonames'
+            return real(*args, **kwargs)
+
+        monkeypatch.setattr(kerykeion, 'AstrologicalSubject', no_geonames)
+        subject = calc._make_subject('x', 1993, 10, 20, 16, 14, bd)
+        assert (subject.lat, subject.lng) == (40.23384, -111.65853)
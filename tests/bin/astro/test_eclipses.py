@@ -11,6 +11,8 @@ Plus solver units exercising the lunar-vs-solar longitude convention,
 the conj-opp default aspect set, and iteration termination.
 """
 
+import pytest
+
 # =============================================================================
 # Reference reproductions: NASA-published 2024 eclipses
 # =============================================================================
@@ -165,3 +167,47 @@ class TestAspectSetFiltering:
             f"expected at least one sextile/square/trine hit in `all` mode; "
             f"got only {aspect_kinds}"
         )
+
+
+# =============================================================================
+# Persistent catalog
+# =============================================================================
+
+class TestEclipseCatalog:
+    """eclipses_in_range answers from a catalog on disk, searched once."""
+
+    def test_matches_direct_search(self, astro_module, tmp_path):
+        import swisseph as swe
+        catalog = astro_module.EclipseCatalog(tmp_path / "eclipses.json")
+        jd0, jd1 = swe.julday(2024, 1, 1, 0), swe.julday(2030, 1, 1, 0)
+        rows = catalog.between(jd0, jd1, ('solar',))
+        direct = astro_module.EclipseCatalog._search('solar', jd0, jd1)
+        assert [(jd, lon) for _, jd, lon in rows] == [tuple(r) for r in direct]
+
+    def test_reloaded_catalog_does_not_search(self, astro_module, tmp_path, monkeypatch):
+        import swisseph as swe
+        path = tmp_path / "eclipses.json"
+        jd0 = swe.julday(2026, 1, 1, 0)
+        first = astro_module.EclipseCatalog(path).between(jd0, jd0 + 3 * 365.25)
+        monkeypatch.setattr(astro_module.EclipseCatalog, '_search',
+                            staticmethod(lambda *a: pytest.fail('searched again')))
+        again = astro_module.EclipseCatalog(path).between(jd0, jd0 + 3 * 365.25)
+        assert again == first
+        assert {kind for kind, _, _ in first} == {'solar', 'lunar'}
+
+    def test_extends_past_either_edge(self, astro_module, tmp_path):
+        import swisseph as swe
+        catalog = astro_module.EclipseCatalog(tmp_path / "eclipses.json")
+        jd0 = swe.julday(2026, 1, 1, 0)
+        catalog.between(jd0, jd0 + 365.25, ('lunar',))
+        span = dict(catalog.spans['lunar'])
+        later = catalog.between(span['jd1'] - 365.25, span['jd1'] + 365.25, ('lunar',))
+        earlier = catalog.between(jd0 - 365.25, jd0, ('lunar',))
+        assert catalog.spans['lunar']['jd0'] < span['jd0']
+        assert catalog.spans['lunar']['jd1'] > span['jd1']
+        for kind, start, end, got in (('lunar', span['jd1'] - 365.25, span['jd1'] + 365.25, later),
+                                      ('lunar', jd0 - 365.25, jd0, earlier)):
+            direct = astro_module.EclipseCatalog._search(kind, start, end)
+            assert [(jd, lon) for _, jd, lon in got] == [tuple(r) for r in direct]
+        jds = [e[0] for e in catalog.spans['lunar']['eclipses']]
+        assert jds == sorted(set(jds))
@@ -0,0 +1,173 @@
+"""Tests for the batch ephemeris layer (EphemerisTable).
+
+The forecast-style loops (`forecast`, sustained aspects, relocated angle
+transits) read positions from one EphemerisTable instead of building a
+kerykeion subject per day. The per-day transit cache has always held
+kerykeion's SynastryAspects output, so the batch path must reproduce it row
+for row: same points, same orbs, same order, same signs and houses.
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+
+def _kerykeion_day(astro_module, transit_calc, chart, day):
+    """Transit events for noon on `day` the way kerykeion reports them: a
+    transit subject, SynastryAspects against the natal subject, signs from
+    the subjects and transit houses against the natal cusps."""
+    from kerykeion import SynastryAspects
+    ctx = transit_calc.natal_context(chart)
+    transit = transit_calc._make_subject(
+        "Transit", day.year, day.month, day.day, 12, 0, chart.birth_data)
+    events = []
+    for asp in SynastryAspects(transit, ctx.subject).relevant_aspects:
+        planet = transit_calc._get_planet_obj(transit, asp['p1_name'])
+        # kerykeion negates the South Node's speed; it moves with the North Node
+        mover = transit_calc._get_planet_obj(
+            transit, 'True_North_Lunar_Node' if asp['p1_name'] == 'True_South_Lunar_Node'
+            else asp['p1_name'])
+        n_sign, n_house = transit_calc._get_planet_position(ctx.subject, asp['p2_name'])
+        events.append(astro_module.TransitEvent(
+            transit_planet=asp['p1_name'], natal_planet=asp['p2_name'],
+            aspect=asp['aspect'], orb=asp['orbit'],
+            transit_sign=planet.sign, transit_house=ctx.cusps.house_of(planet.abs_pos),
+            natal_sign=n_sign, natal_house=n_house,
+            applying=bool(astro_module._applying(asp['p1_abs_pos'], mover.speed or 0.0,
+                                                 asp['p2_abs_pos'], asp['aspect_degrees'])),
+        ))
+    return events
+
+
+def _angle_aspect(planet_lon, angle_lon, max_orb):
+    """(aspect, orb) of the first Ptolemaic aspect within max_orb, scalar."""
+    diff = abs(((planet_lon - angle_lon + 180) % 360) - 180)
+    for name, target in (('conjunction', 0), ('sextile', 60), ('square', 90),
+                         ('trine', 120), ('opposition', 180)):
+        if abs(diff - target) <= max_orb:
+            return name, abs(diff - target)
+    return None
+
+
+# =============================================================================
+# Positions: one table row == one daily kerykeion subject
+# =============================================================================
+
+class TestEphemerisTablePositions:
+
+    @pytest.mark.parametrize("day", [date(2026, 1, 15), date(2026, 3, 8), date(2026, 11, 1)])
+    def test_row_matches_kerykeion_subject(self, astro_module, transit_calc,
+                                           birth_data, day):
+        """Longitude and speed of every active point match the subject built
+        for local noon. 2026-03-08 and 2026-11-01 are the US DST switch days."""
+        table = transit_calc._transit_table([day], birth_data)
+        subj = transit_calc._make_subject(
+            "Transit", day.year, day.month, day.day, 12, 0, birth_data,
+        )
+        assert table.jd[0] == pytest.approx(subj.julian_day, abs=1e-9)
+
+        model = subj.model()
+        for name in astro_module.EphemerisTable.ACTIVE_POINTS:
+            col = table.column(name)
+            point = getattr(model, name.lower())
+            assert table.lon[0, col] == pytest.approx(point.abs_pos, abs=1e-9), name
+        for name in ('Sun', 'Moon', 'Mercury', 'Pluto', 'True_North_Lunar_Node'):
+            col = table.column(name)
+            assert table.speed[0, col] == pytest.approx(getattr(model, name.lower()).speed,
+                                                        abs=1e-9), name
+
+    def test_row_duck_types_subject(self, transit_calc, birth_data):
+        """_get_planet_obj resolves rows exactly like subjects, including the
+        'true_node' alias and the asteroid fallback via julian_day."""
+        day = date(2026, 5, 4)
+        row = transit_calc._transit_table([day], birth_data).row(0)
+        subj = transit_calc._make_subject("Transit", 2026, 5, 4, 12, 0, birth_data)
+        for name in ('saturn', 'true_node', 'chiron', 'ceres'):
+            a = transit_calc._get_planet_obj(row, name)
+            b = transit_calc._get_planet_obj(subj, name)
+            assert a.sign == b.sign, name
+            assert a.abs_pos == pytest.approx(b.abs_pos, abs=1e-9), name
+
+
+# =============================================================================
+# Aspects: batch rows == kerykeion's SynastryAspects
+# =============================================================================
+
+class TestTableTransits:
+
+    def test_matches_kerykeion(self, astro_module, transit_calc, birth_data):
+        chart = astro_module.NatalChart(
+            name="anthony_test_batch", birth_data=birth_data,
+            created_at="2026-01-01T00:00:00",
+        )
+        days = [date(2026, 1, 1) + timedelta(days=41 * k) for k in range(8)]
+        table = transit_calc._transit_table(days, birth_data)
+        batch = transit_calc._table_transits(table, transit_calc.natal_context(chart),
+                                             range(len(days)))
+        for i, day in enumerate(days):
+            ref = _kerykeion_day(astro_module, transit_calc, chart, day)
+            got = batch[i]
+            assert transit_calc.compute_day_transits(chart, day) == got
+            assert [(e.transit_planet, e.natal_planet, e.aspect) for e in got] == \
+                   [(e.transit_planet, e.natal_planet, e.aspect) for e in ref], day
+            for g, r in zip(got, ref):
+                assert g.orb == pytest.approx(r.orb, abs=1e-9)
+                assert g.applying == r.applying
+                assert (g.transit_sign, g.transit_house, g.natal_sign, g.natal_house) == \
+                       (r.transit_sign, r.transit_house, r.natal_sign, r.natal_house)
+
+    def test_forecast_builds_no_daily_subjects(self, astro_module, birth_data,
+                                               tmp_path, monkeypatch):
+        """A cold 90-day forecast builds the natal subject and nothing else."""
+        monkeypatch.setattr(astro_module, '_NATAL_CONTEXTS', {})
+        storage = astro_module.AstroStorage(base_path=tmp_path)
+        calc = astro_module.TransitCalculator(storage)
+        chart = astro_module.NatalChart(
+            name="anthony_test_nosubj", birth_data=birth_data,
+            created_at="2026-01-01T00:00:00",
+        )
+        built = []
+        real = calc._make_subject
+
+        def counting(name, *args):
+            built.append(name)
+            return real(name, *args)
+
+        monkeypatch.setattr(calc, '_make_subject', counting)
+        forecast = calc.forecast_transits(chart, days=90, start_date=datetime(2026, 5, 4))
+        assert forecast
+        assert built == [birth_data.full_name]
+
+
+# =============================================================================
+# Relocated angles
+# =============================================================================
+
+class TestRelocAnglesBatch:
+
+    def test_hits_agree_with_scalar_aspect_check(self, astro_module, transit_calc,
+                                                 birth_data):
+        """Every batch hit is confirmed by a scalar aspect check, and every
+        scalar hit on a sampled day is present in the batch output."""
+        chart = astro_module.NatalChart(
+            name="anthony_test_reloc", birth_data=birth_data,
+            created_at="2026-01-01T00:00:00",
+        )
+        rc = astro_module.RelocationCalculator(transit_calc.storage, transit_calc)
+        hits = rc.transits_to_reloc_angles(chart, 50.0755, 14.4378, days=60,
+                                           start_date=datetime(2026, 1, 1), orb=1.5)
+        assert hits
+        for h in hits:
+            aspect, orb = _angle_aspect(h['transit_lon'], h['angle_lon'], max_orb=1.5)
+            assert aspect == h['aspect']
+            assert orb == pytest.approx(h['orb'], abs=1e-9)
+
+        reloc = rc.relocate_subject(chart, 50.0755, 14.4378)
+        angles = rc.angle_longitudes(reloc)
+        subj = transit_calc._make_subject("Transit", 2026, 1, 20, 12, 0, birth_data)
+        on_day = {(h['transit_planet'], h['angle']) for h in hits if h['date'] == '2026-01-20'}
+        for planet in rc.TRANSIT_PLANETS:
+            lon = transit_calc._get_planet_obj(subj, planet).abs_pos
+            for code, angle_lon in angles.items():
+                if _angle_aspect(lon, angle_lon, max_orb=1.5):
+                    assert (planet, code) in on_day
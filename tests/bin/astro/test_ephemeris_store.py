@@ -0,0 +1,78 @@
+"""Tests for the precomputed ephemeris store (`astro build-ephemeris`).
+
+Mundane, sky and lunar-phase lookups don't depend on a chart, so they read
+positions interpolated from a memory-mapped grid instead of casting a
+kerykeion subject per day. Interpolated values must stay within a small
+tolerance of swisseph, and anything the grid doesn't cover falls back to
+computing directly.
+"""
+
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="module")
+def store(astro_module, tmp_path_factory):
+    directory = tmp_path_factory.mktemp("ephemeris")
+    astro_module.EphemerisStore.build(directory, start_year=2026, end_year=2026)
+    return astro_module.EphemerisStore.open(directory)
+
+
+class TestEphemerisStore:
+
+    def test_interpolation_matches_swisseph(self, astro_module, store):
+        rng = np.random.default_rng(5)
+        jds = store.jd0 + rng.uniform(0, store.jd1 - store.jd0, 400)
+        bodies = astro_module.EphemerisStore.BODIES
+        got = astro_module.EphemerisTable(jds, bodies=bodies, store=store)
+        ref = astro_module.EphemerisTable(jds, bodies=bodies)
+        err = np.abs(astro_module._wrap180(got.lon - ref.lon))
+        # Moon on a daily grid is the worst case; the rest is ephemeris noise
+        assert err.max() < 5e-3
+        assert err[:, got.column('Moon')].max() < 1e-3
+        assert np.abs(got.speed - ref.speed).max() < 0.02
+
+    def test_grid_points_are_exact(self, astro_module, store):
+        jds = store.jd0 + np.arange(0, 300, 37.0)
+        got = astro_module.EphemerisTable(jds, store=store)
+        ref = astro_module.EphemerisTable(jds)
+        np.testing.assert_allclose(got.lon, ref.lon, atol=1e-9)
+        np.testing.assert_allclose(got.speed, ref.speed, atol=1e-9)
+
+    def test_outside_grid_falls_back(self, astro_module, store):
+        jds = np.array([store.jd1 - 1.0, store.jd1 + 3.0])
+        assert not store.covers(jds, astro_module.EphemerisTable.BODIES)
+        got = astro_module.EphemerisTable(jds, store=store)
+        ref = astro_module.EphemerisTable(jds)
+        np.testing.assert_array_equal(got.lon, ref.lon)
+
+
+class TestMundaneWithoutSubjects:
+
+    @pytest.fixture
+    def calc(self, astro_module, store, tmp_path, monkeypatch):
+        storage = astro_module.AstroStorage(base_path=tmp_path)
+        monkeypatch.setattr(storage, 'ephemeris_store', lambda: store)
+        calc = astro_module.TransitCalculator(storage)
+        monkeypatch.setattr(calc, '_make_subject',
+                            lambda *a, **k: pytest.fail('built a kerykeion subject'))
+        return calc
+
+    def test_forecast_and_sky(self, astro_module, calc):
+        forecast = calc.forecast_mundane_transits(
+            60, start_date=datetime(2026, 3, 1), include_moon_ingress=True)
+        events = [e for _, day in forecast for e in day]
+        assert any(e.transit_planet == 'Full Moon' for e in events)
+        ingress = [e for e in events if e.aspect == 'sign_ingress' and e.transit_planet == 'Sun']
+        assert ('Ari', '2026-03-20 14:46') in {(e.transit_sign, e.exact_date) for e in ingress}
+
+        row = calc._sky_table([datetime(2026, 3, 20, 15, 0)], hour=15).row(0)
+        positions = calc.collect_planet_positions(row)
+        assert positions[0]['planet'] == 'Sun' and positions[0]['sign'] == 'Ari'
+
+    def test_lunar_phase(self, calc):
+        # Full Moon 2026-03-03 11:38 UTC
+        assert calc.get_lunar_phase(date(2026, 3, 3)).transit_planet == 'Full Moon'
+        assert calc.get_lunar_phase(date(2026, 3, 10)) is None
@@ -0,0 +1,164 @@
+"""Tests for ExactTimes — exact aspect, ingress and station moments.
+
+`forecast`, `now` and `planet` used to report the noon sample on which
+something changed; ExactTimes finds the moment itself by root finding, which
+is what fills `TransitEvent.exact_date` / `applying` and times every
+`planet` event.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+ONE_MINUTE = 1.0 / 1440.0
+
+
+# =============================================================================
+# Root finding
+# =============================================================================
+
+class TestExactTimes:
+
+    def test_bracketed_root_with_and_without_slope(self, astro_module):
+        def with_slope(x):
+            return x * x - 2.0, 2.0 * x
+
+        def without(x):
+            return x * x - 2.0, None
+
+        for f in (with_slope, without):
+            root = astro_module._bracketed_root(f, 0.0, 2.0, -2.0, 2.0)
+            assert root == pytest.approx(2.0 ** 0.5, abs=1e-4)
+
+    def test_equinox_matches_swisseph_solcross(self, astro_module):
+        """Sun reaching 0° Aries, against swisseph's own crossing search."""
+        jd0 = swe.julday(2026, 1, 1, 0.0)
+        times = astro_module.ExactTimes(swe.SUN, jd0, jd0 + 365.0)
+        hits = times.crossings([0.0])
+        assert len(hits) == 1
+        assert hits[0][0] == pytest.approx(swe.solcross_ut(0.0, jd0), abs=ONE_MINUTE)
+        assert astro_module._fmt_exact(hits[0][0], None) == '2026-03-20 14:46'
+
+    def test_crossings_land_on_target(self, astro_module):
+        """Every Moon and Mercury crossing of a target sits on it (to well
+        under a minute of the Moon's motion), and
+        Mercury (which retrogrades) crosses some longitudes three times."""
+        jd0 = swe.julday(2026, 1, 1, 12.0)
+        targets = [0.5, 123.4, 350.0]
+        for body in (swe.MOON, swe.MERCURY):
+            times = astro_module.ExactTimes(body, jd0, jd0 + 365.0)
+            for jd, t in times.crossings(targets):
+                lon = times.state(jd)[0]
+                assert abs(astro_module._wrap180(lon - targets[t])) < 1e-3
+        mercury = astro_module.ExactTimes(swe.MERCURY, jd0, jd0 + 365.0)
+        lo, hi = mercury.stations()[0][0], mercury.stations()[1][0]
+        middle = mercury.state(0.5 * (lo + hi))[0]
+        assert len(mercury.crossings([middle], lo - 30, hi + 30)) >= 3
+
+    def test_stations_have_zero_speed(self, astro_module):
+        jd0 = swe.julday(2026, 1, 1, 12.0)
+        times = astro_module.ExactTimes(swe.MERCURY, jd0, jd0 + 365.0)
+        stations = times.stations()
+        # Mercury goes retrograde three times a year, so six stations
+        assert [k for _, k in stations] == ['station_retrograde', 'station_direct'] * 3
+        for jd, kind in stations:
+            assert abs(times.state(jd)[1]) < 1e-5
+            after = times.state(jd + 1.0)[1]
+            assert (after > 0) == (kind == 'station_direct')
+
+    @pytest.mark.parametrize("body", [swe.MERCURY, swe.MARS, swe.SATURN, swe.PLUTO])
+    def test_speed_scheduled_station_search(self, astro_module, monkeypatch, body):
+        """Stepping by |speed| / MAX_ACCEL finds the stations a fixed
+        daily scan finds, with fewer samples."""
+        jd0 = swe.julday(2000, 1, 1, 12.0)
+        jd1 = jd0 + 30 * 365.25
+        times = astro_module.ExactTimes(body, jd0, jd1)
+        calls = []
+        real = times.state
+        monkeypatch.setattr(times, 'state', lambda jd: (calls.append(jd), real(jd))[1])
+        got = times.stations()
+
+        jds = [jd0 + k for k in range(int(jd1 - jd0) + 1)]
+        speeds = [real(jd)[1] for jd in jds]
+        flips = [a for a, sa, sb in zip(jds, speeds, speeds[1:]) if sa * sb < 0]
+        assert len(got) == len(flips)
+        for (jd, _), a in zip(got, flips):
+            assert a <= jd <= a + 1.0
+        fixed = (jd1 - jd0) / astro_module.ExactTimes.STATION_STEP.get(
+            body, astro_module.ExactTimes.DEFAULT_STATION_STEP)
+        assert len(calls) < len(jds) and len(calls) - 10 * len(got) < fixed
+
+    def test_max_accel_bounds_speed_change(self, astro_module):
+        """MAX_ACCEL holds between daily samples (what the schedule relies on).
+        swisseph's speeds have rare one-sample blips (Saturn, Pluto around
+        2019-01), so each sample is the median of three."""
+        jd0 = swe.julday(2018, 1, 1, 12.0)
+        for body, accel in astro_module.ExactTimes.MAX_ACCEL.items():
+            step = 0.1 if body == swe.TRUE_NODE else 1.0
+            times = astro_module.ExactTimes(body, jd0, jd0 + 800)
+            raw = np.array([times.state(jd0 + k * step)[1] for k in range(int(800 / step))])
+            speeds = np.median([raw[:-2], raw[1:-1], raw[2:]], axis=0)
+            worst = np.abs(np.diff(speeds)).max() / step
+            assert worst < accel, body
+
+
+# =============================================================================
+# Calculators
+# =============================================================================
+
+class TestTimedEvents:
+
+    @pytest.fixture
+    def chart(self, astro_module, birth_data):
+        return astro_module.NatalChart(name="anthony_test_exact", birth_data=birth_data,
+                                       created_at="2026-01-01T00:00:00")
+
+    def test_forecast_aspects_timed(self, astro_module, transit_calc, chart):
+        """Highlight aspects carry the moment they perfect, and `applying`
+        agrees with which side of the day's noon sample that moment is on."""
+        forecast = transit_calc.forecast_transits(chart, days=30,
+                                                  start_date=datetime(2026, 5, 4))
+        timed = 0
+        for date_str, events in forecast:
+            noon = datetime.fromisoformat(f"{date_str} 12:00")
+            for e in events:
+                if e.natal_planet == "" or not e.exact_date:
+                    continue
+                exact = datetime.fromisoformat(e.exact_date)
+                timed += 1
+                if abs((exact - noon).total_seconds()) > 120:
+                    assert e.applying == (exact > noon), (date_str, e)
+        assert timed > 10
+
+    def test_position_events_timed_between_samples(self, astro_module, transit_calc, chart):
+        forecast = transit_calc.forecast_transits(chart, days=60,
+                                                  start_date=datetime(2026, 2, 1))
+        ingresses = [(d, e) for d, es in forecast for e in es
+                     if e.aspect in ('sign_ingress', 'house_ingress', 'station_retrograde')]
+        assert ingresses
+        for date_str, e in ingresses:
+            exact = datetime.fromisoformat(e.exact_date)
+            noon = datetime.fromisoformat(f"{date_str} 12:00")
+            assert 0 <= (noon - exact).total_seconds() <= 86400, (date_str, e)
+
+    def test_track_planet_events_exact(self, astro_module, transit_calc, chart):
+        """Sign changes sit on a sign boundary, stations at zero speed, and
+        each event is dated by its own exact moment."""
+        events = transit_calc.track_planet(chart, 'mercury', datetime(2026, 1, 1),
+                                           datetime(2026, 12, 31))
+        kinds = {e.event_type for e in events}
+        assert {'sign_change', 'house_change', 'station_retrograde',
+                'station_direct', 'aspect'} <= kinds
+        for e in events:
+            if e.exact:
+                assert e.date == e.exact[:10]
+            if e.event_type.startswith('station'):
+                assert abs(e.speed) < 1e-4
+        # A pass that never perfects marks its closest approach: a station,
+        # or the (untimed) edge of the window
+        exacts = [e for e in events if e.aspect.endswith('(exact)')]
+        assert exacts
+        assert all(e.orb < 1e-3 or abs(e.speed) < 1e-3 or not e.exact for e in exacts)
+        assert [e.date for e in events] == sorted(e.date for e in events)
@@ -0,0 +1,134 @@
+"""Tests for the streaming forecast (`iter_forecast`, `forecast --format
+ics|ndjson --stream`).
+
+The window is resolved a chunk at a time and each day is yielded as soon as
+it is done; the ICS and NDJSON writers consume days as they arrive.
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+START = datetime(2026, 1, 1)
+
+
+@pytest.fixture
+def chart(astro_module, birth_data):
+    return astro_module.NatalChart('anthony_stream', birth_data, '2026-01-01T00:00:00')
+
+
+@pytest.fixture
+def calc(astro_module, tmp_path):
+    return astro_module.TransitCalculator(astro_module.AstroStorage(base_path=tmp_path))
+
+
+class TestIterForecast:
+
+    def test_chunks_match_one_window(self, calc, chart, monkeypatch):
+        whole = calc.forecast_transits(chart, 40, start_date=START, include_moon_ingress=True)
+        monkeypatch.setattr(calc, 'FORECAST_CHUNK_DAYS', 7)
+        chunked = list(calc.iter_forecast(chart, 40, start_date=START, include_moon_ingress=True))
+        assert [d for d, _ in chunked] == [d for d, _ in whole]
+        for (_, a), (_, b) in zip(whole, chunked):
+            # Exact times are roots of the same function from other brackets
+            assert [vars(e) | {'exact_date': None} for e in a] == \
+                   [vars(e) | {'exact_date': None} for e in b]
+            for e, f in zip(a, b):
+                assert (e.exact_date is None) == (f.exact_date is None)
+                if e.exact_date:
+                    gap = (datetime.fromisoformat(e.exact_date)
+                           - datetime.fromisoformat(f.exact_date)).total_seconds()
+                    assert abs(gap) <= 60
+
+    def test_first_day_before_rest_of_window(self, calc, chart, monkeypatch):
+        reads = []
+        real = calc.storage.get_range
+        monkeypatch.setattr(calc.storage, 'get_range', lambda *a: reads.append(a) or real(*a))
+        monkeypatch.setattr(calc, 'FORECAST_CHUNK_DAYS', 10)
+        days = calc.iter_forecast(chart, 100, start_date=START)
+        date_str, _ = next(days)
+        assert date_str < '2026-01-11' and len(reads) == 1
+        assert all(d > date_str for d, _ in days)
+        assert len(reads) == 10
+
+
+class TestFormats:
+
+    def test_ndjson(self, astro_module, calc, chart):
+        forecast = calc.forecast_transits(chart, 20, start_date=START)
+        lines = list(astro_module.TransitFormatter().forecast_ndjson(iter(forecast)))
+        assert [json.loads(line) for line in lines] == [
+            {'date': d, 'events': [vars(e) for e in events]} for d, events in forecast]
+
+    def test_ics(self, astro_module, calc, chart):
+        forecast = calc.forecast_transits(chart, 60, start_date=START)
+        stamp = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        ics = "".join(astro_module.TransitFormatter().forecast_ics(iter(forecast), chart, stamp))
+        assert ics.endswith("END:VCALENDAR\r\n")
+        lines = ics.split("\r\n")[:-1]
+        assert lines[0] == "BEGIN:VCALENDAR"
+        assert all(len(line.encode()) <= 75 for line in lines)
+        unfolded = ics.replace("\r\n ", "").split("\r\n")
+        uids = [line for line in unfolded if line.startswith("UID:")]
+        assert len(uids) == len(set(uids)) == unfolded.count("BEGIN:VEVENT") > 0
+        assert "DTSTAMP:20260101T000000Z" in unfolded
+        # Slow aspects stay in orb for days but are one event at their exact moment
+        timed = sum(1 for _, events in forecast for e in events if e.exact_date)
+        assert sum(1 for line in unfolded if line.startswith("DTSTART:")) < timed
+
+    def test_ics_runs(self, astro_module, chart):
+        ev = astro_module.TransitEvent
+        angle = ev('Uranus', 'ASC', 'square', 0.5)
+        exact = [ev('Jupiter', 'Mercury', 'trine', 0.2, exact_date=when)
+                 for when in ('2026-01-03 05:41', '2026-01-03 05:42', '2026-02-20 11:00')]
+        forecast = [('2026-01-01', [angle, exact[0]]),
+                    ('2026-01-02', [angle, exact[1]]),   # the next chunk's exact time
+                    ('2026-01-03', [angle]),
+                    ('2026-02-20', [exact[2]]),          # a second pass
+                    ('2026-02-21', [angle])]
+        stamp = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        ics = "".join(astro_module.TransitFormatter().forecast_ics(iter(forecast), chart, stamp))
+        unfolded = ics.replace("\r\n ", "").split("\r\n")
+        starts = [line for line in unfolded if line.startswith("DTSTART")]
+        ends = [line for line in unfolded if line.startswith("DTEND")]
+        assert len(starts) == 4
+        assert ends == ["DTEND;VALUE=DATE:20260104", "DTEND;VALUE=DATE:20260222"]
+        assert "DTSTART;VALUE=DATE:20260101" in starts
+        uids = [line for line in unfolded if line.startswith("UID:")]
+        assert len(set(uids)) == 4
+
+    def test_ics_line_folding(self, astro_module):
+        line = "SUMMARY:" + "☉" * 40
+        folded = astro_module._ics_line(line)
+        parts = folded[:-2].split("\r\n")
+        assert all(len(p.encode()) <= 75 for p in parts)
+        assert "".join(p[1:] if i else p for i, p in enumerate(parts)) == line
+        assert astro_module._ics_text("a,b;c\\d\ne") == "a\\,b\\;c\\\\d\\ne"
+
+
+class TestCli:
+
+    @pytest.fixture
+    def home(self, astro_module, birth_data, tmp_path, monkeypatch):
+        monkeypatch.setenv('HOME', str(tmp_path))
+        astro_module.AstroStorage().save_chart(
+            astro_module.NatalChart('default', birth_data, '2026-01-01T00:00:00'))
+
+    @pytest.mark.parametrize("fmt", ['text', 'ndjson', 'ics'])
+    def test_stream_same_output(self, astro_module, home, capsys, fmt):
+        argv = ['forecast', '--date', '2026-01-01', '--days', '10', '--format', fmt]
+        astro_module.main(argv)
+        plain = capsys.readouterr().out
+        astro_module.main([*argv, '--stream'])
+        streamed = capsys.readouterr().out
+        if fmt == 'ics':
+            # DTSTAMP is the time of the run
+            plain, streamed = ([line for line in out.split("\r\n") if not line.startswith("DTSTAMP")]
+                               for out in (plain, streamed))
+        assert streamed == plain
+
+    def test_all_charts_rejects_format(self, astro_module, home, capsys):
+        with pytest.raises(SystemExit):
+            astro_module.main(['forecast', '--all-charts', '--format', 'ics'])
+        assert '--all-charts' in capsys.readouterr().err
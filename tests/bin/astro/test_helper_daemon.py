@@ -0,0 +1,204 @@
+"""Tests for the warm helper mode (`astro-*-helper --serve`).
+
+`_run_helper` sends progressions / ZR requests to one long-lived helper per
+script over a Unix socket instead of paying uv + interpreter + library
+startup per call. The helpers' own libraries (immanuel, stellium) aren't
+needed here: the serve loop is exercised with a stub command table.
+"""
+
+import importlib.machinery
+import json
+import importlib.util
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+HELPERS = ("astro-progressions-helper", "astro-zr-helper")
+
+
+def _load_helper(astro_module, name):
+    path = Path(astro_module.__file__).parent / name
+    loader = importlib.machinery.SourceFileLoader(name.replace('-', '_'), str(path))
+    spec = importlib.util.spec_from_file_location(loader.name, path, loader=loader)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture
+def short_dir():
+    # AF_UNIX paths are limited to ~104 bytes; pytest's tmp_path can exceed it
+    with tempfile.TemporaryDirectory(dir='/tmp') as d:
+        yield Path(d)
+
+
+def _serve(helper, sock, idle_ttl=5.0):
+    helper.COMMANDS = {'echo': lambda req: {'echo': req['x']}}
+    thread = threading.Thread(target=helper.astro_helper.serve,
+                              args=(str(sock), helper.COMMANDS, idle_ttl), daemon=True)
+    thread.start()
+    for _ in range(100):
+        if sock.exists():
+            break
+        time.sleep(0.01)
+    return thread
+
+
+class TestServeLoop:
+
+    @pytest.mark.parametrize("name", HELPERS)
+    def test_round_trip_and_errors(self, astro_module, short_dir, name):
+        helper = _load_helper(astro_module, name)
+        sock = short_dir / "h.sock"
+        _serve(helper, sock)
+        assert astro_module._helper_request(sock, {'command': 'echo', 'x': 3}) == \
+            {'ok': True, 'result': {'echo': 3}}
+        err = astro_module._helper_request(sock, {'command': 'nope'})
+        assert not err['ok'] and 'Unknown command' in err['error']
+        # Same process keeps answering
+        assert astro_module._helper_request(sock, {'command': 'echo', 'x': 4})['result'] == {'echo': 4}
+
+    def test_idle_exit_removes_socket(self, astro_module, short_dir):
+        helper = _load_helper(astro_module, HELPERS[0])
+        sock = short_dir / "h.sock"
+        thread = _serve(helper, sock, idle_ttl=0.2)
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert not sock.exists()
+
+    def test_helpers_share_one_serve_loop(self, astro_module):
+        first, second = (_load_helper(astro_module, name) for name in HELPERS)
+        assert first.astro_helper is second.astro_helper
+
+    def test_socket_follows_shared_module(self, astro_module, tmp_path, monkeypatch):
+        monkeypatch.setattr(astro_module, '_HELPER_STATE_DIR', tmp_path)
+        helper = tmp_path / HELPERS[0]
+        helper.write_text("")
+        lib = tmp_path / astro_module._HELPER_LIB
+        lib.write_text("")
+        before = astro_module._helper_socket(helper)
+        lib.write_text("# edited\n")
+        assert astro_module._helper_socket(helper) != before
+
+
+class TestRunHelper:
+
+    def test_reuses_warm_helper(self, astro_module, short_dir, monkeypatch):
+        monkeypatch.setattr(astro_module, '_HELPER_STATE_DIR', short_dir)
+        monkeypatch.setenv('ASTRO_HELPER_DAEMON', '1')
+        name = HELPERS[1]
+        sock = astro_module._helper_socket(Path(astro_module.__file__).parent / name)
+        _serve(_load_helper(astro_module, name), sock)
+
+        def no_process(*a, **k):
+            pytest.fail('started a helper process')
+
+        monkeypatch.setattr(subprocess, 'run', no_process)
+        monkeypatch.setattr(subprocess, 'Popen', no_process)
+        assert astro_module._run_helper(name, {'command': 'echo', 'x': 'a'}) == {'echo': 'a'}
+        assert astro_module._run_helper(name, {'command': 'echo', 'x': 'b'}) == {'echo': 'b'}
+        with pytest.raises(RuntimeError, match='Unknown command'):
+            astro_module._run_helper(name, {'command': 'nope'})
+
+    def test_opt_out_runs_once_per_call(self, astro_module, short_dir, monkeypatch):
+        monkeypatch.setattr(astro_module, '_HELPER_STATE_DIR', short_dir)
+        monkeypatch.setenv('ASTRO_HELPER_DAEMON', '0')
+        calls = []
+
+        def fake_run(argv, **kwargs):
+            calls.append(argv)
+            return subprocess.CompletedProcess(argv, 0, stdout='{"echo": 1}', stderr='')
+
+        monkeypatch.setattr(subprocess, 'run', fake_run)
+        assert astro_module._run_helper(HELPERS[0], {'command': 'echo'}) == {'echo': 1}
+        assert len(calls) == 1 and not any(short_dir.iterdir())
+
+
+class TestStreaming:
+    """Generator commands stream one reply line per item."""
+
+    @pytest.mark.parametrize("name", HELPERS)
+    def test_warm_helper_streams_items(self, astro_module, short_dir, monkeypatch, name):
+        monkeypatch.setattr(astro_module, '_HELPER_STATE_DIR', short_dir)
+        monkeypatch.setenv('ASTRO_HELPER_DAEMON', '1')
+        helper = _load_helper(astro_module, name)
+        sock = astro_module._helper_socket(Path(astro_module.__file__).parent / name)
+        _serve(helper, sock)
+
+        def count(req):
+            for i in range(req['n']):
+                if i == req.get('fail_at'):
+                    raise ValueError('boom')
+                yield {'i': i}
+
+        helper.COMMANDS['count'] = count
+        assert list(astro_module._stream_helper(name, {'command': 'count', 'n': 3})) == \
+            [{'i': 0}, {'i': 1}, {'i': 2}]
+        got = []
+        with pytest.raises(RuntimeError, match='boom'):
+            for item in astro_module._stream_helper(name, {'command': 'count', 'n': 3,
+                                                           'fail_at': 2}):
+                got.append(item)
+        assert got == [{'i': 0}, {'i': 1}]
+
+    def test_profile_counts_reads_not_consumer(self, astro_module, short_dir, monkeypatch):
+        monkeypatch.setattr(astro_module, '_HELPER_STATE_DIR', short_dir)
+        monkeypatch.setenv('ASTRO_HELPER_DAEMON', '1')
+        name = HELPERS[0]
+        helper = _load_helper(astro_module, name)
+        _serve(helper, astro_module._helper_socket(Path(astro_module.__file__).parent / name))
+
+        def slow(req):
+            for i in range(3):
+                time.sleep(0.05)
+                yield i
+
+        helper.COMMANDS['slow'] = slow
+        prof = astro_module._Profile()
+        monkeypatch.setattr(astro_module, '_PROFILE', prof)
+        try:
+            for _ in astro_module._stream_helper(name, {'command': 'slow'}):
+                time.sleep(0.2)     # the caller's own work
+        finally:
+            prof.close()
+        # At least the wait for the first item; the helper computes the
+        # rest while the caller works, and that 0.6 s isn't the helper's
+        helper_ms = prof.report(None)['stages']['helper']['total_ms']
+        assert 50 <= helper_ms < 300
+
+    def test_client_hang_up_mid_stream(self, astro_module, short_dir):
+        import socket
+        helper = _load_helper(astro_module, HELPERS[1])
+        sock = short_dir / "h.sock"
+        thread = _serve(helper, sock)
+        helper.COMMANDS['count'] = lambda req: ({'i': i} for i in range(req['n']))
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.connect(str(sock))
+            with s.makefile('rwb') as f:
+                f.write(b'{"command": "count", "n": 1000000}\n')
+                f.flush()
+                assert json.loads(f.readline()) == {'ok': True, 'item': {'i': 0}}
+        assert astro_module._helper_request(sock, {'command': 'echo', 'x': 5}) == \
+            {'ok': True, 'result': {'echo': 5}}
+        assert thread.is_alive() and sock.exists()
+
+    def test_one_shot_stream_and_error(self, astro_module, monkeypatch):
+        monkeypatch.setenv('ASTRO_HELPER_DAEMON', '0')
+        real_popen = subprocess.Popen
+        script = ("import json\n"
+                  "print(json.dumps({'i': 0}))\n"
+                  "print(json.dumps({'i': 1}))\n"
+                  "print(json.dumps({'error': 'boom', 'traceback': ''}))\n"
+                  "raise SystemExit(1)\n")
+        monkeypatch.setattr(subprocess, 'Popen',
+                            lambda argv, **kw: real_popen([sys.executable, '-c', script], **kw))
+        got = []
+        with pytest.raises(RuntimeError, match='boom'):
+            for item in astro_module._stream_helper(HELPERS[0], {'command': 'count'}):
+                got.append(item)
+        assert got == [{'i': 0}, {'i': 1}]
@@ -1,5 +1,7 @@
 """Tests for house placement and natal chart calculations in astro."""
 
+from datetime import datetime
+
 import pytest
 
 
@@ -82,28 +84,31 @@ class TestPlanetInNatalHouse:
         assert calc._planet_in_natal_house(5.0, cusps) == '12'  # wraparound
 
 
+@pytest.fixture(scope="module")
+def natal_chart(astro_module, birth_data):
+    return astro_module.NatalChart(
+        name="anthony_test_houses", birth_data=birth_data,
+        created_at="2026-01-01T00:00:00",
+    )
+
+
 # =============================================================================
 # Integration: transit houses use natal cusps, not transit chart houses
 # =============================================================================
 
 class TestTransitHousesUseNatalCusps:
-    """Regression test: _parse_aspects must use natal cusps for transit houses."""
+    """Regression test: transit events must use natal cusps for transit houses."""
 
     def test_transit_houses_match_natal_cusps(self, astro_module, transit_calc,
-                                              birth_data, natal_subject, natal_cusps):
-        """Every transit house in _parse_aspects output should match
+                                              birth_data, natal_chart, natal_cusps):
+        """Every transit house in _transits_at output should match
         _planet_in_natal_house against natal cusps."""
-        from kerykeion import AstrologicalSubject, SynastryAspects
-
         # Create transit subject for a fixed time (2026-03-24 20:44 MDT = 02:44 UTC Mar 25)
         transit = transit_calc._make_subject(
             "Transit", 2026, 3, 24, 20, 44, birth_data
         )
 
-        aspects = SynastryAspects(transit, natal_subject)
-        events = transit_calc._parse_aspects(
-            aspects.relevant_aspects, transit, natal_subject, natal_cusps
-        )
+        events, _ = transit_calc._transits_at(natal_chart, datetime(2026, 3, 24), 20, 44)
 
         assert len(events) > 0, "Should find at least some transit aspects"
 
@@ -118,19 +123,14 @@ class TestTransitHousesUseNatalCusps:
                 )
 
     def test_transit_house_differs_from_transit_chart_house(self, astro_module, transit_calc,
-                                                             birth_data, natal_subject, natal_cusps):
+                                                             birth_data, natal_chart, natal_cusps):
         """Verify that at least some transit houses differ from what the transit
         chart's own house system would give — proving we use natal cusps."""
-        from kerykeion import AstrologicalSubject, SynastryAspects
-
         transit = transit_calc._make_subject(
             "Transit", 2026, 3, 24, 20, 44, birth_data
         )
 
-        aspects = SynastryAspects(transit, natal_subject)
-        events = transit_calc._parse_aspects(
-            aspects.relevant_aspects, transit, natal_subject, natal_cusps
-        )
+        events, _ = transit_calc._transits_at(natal_chart, datetime(2026, 3, 24), 20, 44)
 
         house_map = {
             'First_House': '1', 'Second_House': '2', 'Third_House': '3',
@@ -175,18 +175,9 @@ class TestAstroSeekReference:
     ORB_TOLERANCE = 0.15  # degrees — allows for ephemeris/time differences
 
     def test_signs_aspects_and_orbs_match(self, astro_module, transit_calc,
-                                           birth_data, natal_subject, natal_cusps):
+                                           birth_data, natal_chart, natal_cusps):
         """Major aspects should match astro-seek's signs, aspect types, and orbs."""
-        from kerykeion import SynastryAspects
-
-        transit = transit_calc._make_subject(
-            "Transit", 2026, 3, 24, 20, 44, birth_data
-        )
-
-        aspects = SynastryAspects(transit, natal_subject)
-        events = transit_calc._parse_aspects(
-            aspects.relevant_aspects, transit, natal_subject, natal_cusps
-        )
+        events, _ = transit_calc._transits_at(natal_chart, datetime(2026, 3, 24), 20, 44)
 
         # Build lookup by (transit_planet, aspect, natal_planet)
         our_aspects = {}
@@ -267,15 +258,9 @@ class TestAstroSeekReference2000:
                 f"house {house} != expected {expected_house}"
             )
 
-    def test_transit_aspects_and_orbs(self, transit_calc, transit_2000,
-                                       natal_subject, natal_cusps):
+    def test_transit_aspects_and_orbs(self, transit_calc, natal_chart):
         """Transit aspects should match astro-seek's reference data."""
-        from kerykeion import SynastryAspects
-
-        aspects = SynastryAspects(transit_2000, natal_subject)
-        events = transit_calc._parse_aspects(
-            aspects.relevant_aspects, transit_2000, natal_subject, natal_cusps
-        )
+        events, _ = transit_calc._transits_at(natal_chart, datetime(2000, 8, 13), 12, 37)
 
         our_aspects = {}
         for e in events:
@@ -0,0 +1,81 @@
+"""Startup budget for commands that never compute.
+
+list-charts, show-chart, locations list, config and clear-cache only read
+JSON and SQLite, so they must not import numpy, swisseph or kerykeion, and
+they stay within a fixed number of imports and wall-clock time over a bare
+interpreter. Fish completions and scripts shell out to them.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+HEAVY = ('numpy', 'swisseph', 'kerykeion')
+IMPORT_BUDGET = 60       # modules over `python -c pass`
+WALL_BUDGET = 0.25       # seconds over `python -c pass`, best of 3
+
+
+@pytest.fixture(scope="module")
+def env(tmp_path_factory):
+    home = tmp_path_factory.mktemp("home")
+    charts = home / ".local" / "share" / "astro" / "charts"
+    charts.mkdir(parents=True)
+    (charts / "default.json").write_text(
+        '{"name": "default", "created_at": "2026-01-01T00:00:00", "birth_data": '
+        '{"full_name": "x", "year": 1993, "month": 10, "day": 20, "hour": 16, '
+        '"minute": 14, "city": "Provo", "nation": "US"}}')
+    return dict(os.environ, HOME=str(home), ASTRO_SERVER='0')
+
+
+def _imports(argv, env):
+    """Top-level names of the modules a run imports."""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', *argv],
+                          env=env, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    return {line.split('|')[-1].strip() for line in proc.stderr.splitlines()
+            if line.startswith('import time:') and not line.endswith('package')}
+
+
+def _best_time(argv, env, runs=3):
+    best = float('inf')
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, *argv], env=env, capture_output=True)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+@pytest.fixture(scope="module")
+def script(astro_module):
+    return str(Path(astro_module.__file__))
+
+
+@pytest.mark.parametrize("command", [
+    ['list-charts'],
+    ['show-chart'],
+    ['locations', 'list'],
+    ['config'],
+    ['clear-cache'],
+])
+def test_no_heavy_imports(script, env, command):
+    baseline = _imports(['-c', 'pass'], env)
+    modules = _imports([script, *command], env)
+    loaded = {m.split('.')[0] for m in modules}
+    assert not loaded & set(HEAVY)
+    assert len(modules - baseline) <= IMPORT_BUDGET
+
+
+def test_list_charts_wall_clock(script, env):
+    baseline = _best_time(['-c', 'pass'], env)
+    assert _best_time([script, 'list-charts'], env) - baseline <= WALL_BUDGET
+
+
+def test_body_numbers_match_swisseph(astro_module):
+    import swisseph as swe
+    consts = {name[3:]: value for name, value in vars(astro_module).items()
+              if name.startswith('SE_')}
+    assert consts == {name: getattr(swe, name) for name in consts}
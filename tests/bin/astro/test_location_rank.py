@@ -0,0 +1,145 @@
+"""Tests for LocationRanker (`astro relocate rank`).
+
+Ranking scores thousands of gazetteer locations without a kerykeion subject
+or an eclipse search per location: the chart-wide inputs are built once and
+each location is scored from them. Every contact it reports must agree with
+what the single-location commands (`relocate chart/lines/parans/eclipses`)
+report for that location.
+"""
+
+import pytest
+
+LATS = [50.0755, -33.8688, 64.1466, -0.1807, 35.6762]
+LNGS = [14.4378, 151.2093, -21.9426, -78.4678, 139.6503]
+JD_START = 2461162.5   # 2026-05-01
+
+
+@pytest.fixture(scope="module")
+def chart(astro_module, birth_data):
+    return astro_module.NatalChart(
+        name="anthony_rank", birth_data=birth_data,
+        created_at="2026-01-01T00:00:00",
+    )
+
+
+@pytest.fixture(scope="module")
+def rcalc(astro_module, transit_calc):
+    return astro_module.RelocationCalculator(transit_calc.storage, transit_calc)
+
+
+@pytest.fixture(scope="module")
+def ranker(astro_module, transit_calc, rcalc):
+    return astro_module.LocationRanker(transit_calc, rcalc)
+
+
+@pytest.fixture(scope="module")
+def inputs(ranker, chart):
+    return ranker.inputs(chart, jd_start=JD_START)
+
+
+class TestRelocatedAngles:
+
+    def test_matches_relocated_subject(self, astro_module, transit_calc, rcalc, chart):
+        jd = transit_calc.natal_context(chart).jd
+        got = rcalc.angles_at(jd, LATS, LNGS)
+        for i, (lat, lng) in enumerate(zip(LATS, LNGS)):
+            ref = rcalc.angle_longitudes(rcalc.relocate_subject(chart, lat, lng))
+            for k, code in enumerate(rcalc.ANGLE_CODES):
+                assert got[i, k] == pytest.approx(ref[code], abs=1e-9), (lat, code)
+
+
+class TestScoreBlock:
+
+    @pytest.fixture(scope="class")
+    def rows(self, ranker, inputs):
+        return ranker.score_block(inputs, LATS, LNGS)
+
+    def test_lines_match_lines_near(self, astro_module, transit_calc, rcalc, chart, rows):
+        acalc = astro_module.AspectLineCalculator(transit_calc, rcalc)
+        for row in rows:
+            ref = acalc.lines_near(chart, row['lat'], row['lng'], max_orb=2.5)
+            assert [r['label'] for r in ref] == [c['label'] for c in row['lines']]
+            for r, c in zip(ref, row['lines']):
+                assert c['km'] == pytest.approx(r['km'], abs=1e-6)
+
+    def test_parans_match_parans_near(self, astro_module, transit_calc, chart, rows):
+        pcalc = astro_module.ParanCalculator(transit_calc)
+        for row in rows:
+            ref = pcalc.parans_near(chart, row['lat'], max_delta_lat=2.5)
+            # Roots are solved once over the globe instead of per window; only
+            # parans within a bisection tolerance of the band edge may differ
+            got = {c['label']: c['delta_lat'] for c in row['parans']}
+            for r in ref:
+                if abs(abs(r['delta_lat']) - 2.5) < 0.01:
+                    continue
+                assert got[r['label']] == pytest.approx(r['delta_lat'], abs=0.01)
+            assert len(got) == pytest.approx(len(ref), abs=2)
+
+    def test_eclipses_match_hits_to_relocated_angles(self, astro_module, transit_calc,
+                                                     rcalc, chart, rows):
+        ecalc = astro_module.EclipseCalculator(transit_calc, rcalc)
+        for row in rows:
+            ref = ecalc.hits_to_relocated_angles(chart, row['lat'], row['lng'],
+                                                 jd_start=JD_START)
+            assert row['eclipses'] == ref
+
+    def test_angle_contacts_and_score(self, astro_module, rcalc, chart, ranker,
+                                      inputs, rows):
+        planet_lon = dict(inputs.planets)
+        for row in rows:
+            angles = rcalc.angle_longitudes(rcalc.relocate_subject(chart, row['lat'], row['lng']))
+            for c in row['angles']:
+                orb = abs(astro_module._wrap180(planet_lon[c['planet']] - angles[c['angle']]))
+                assert c['orb_deg'] == pytest.approx(orb, abs=1e-9)
+                assert orb <= ranker.ANGLE_ORB
+            weights = ranker.WEIGHTS
+            assert row['score'] == pytest.approx(
+                sum(weights[k] * v for k, v in row['components'].items()))
+
+
+class TestRank:
+
+    def test_parallel_matches_serial(self, astro_module, ranker, inputs, monkeypatch):
+        monkeypatch.setattr(astro_module.LocationRanker, 'BLOCK', 2)
+        serial = ranker.rank(inputs, LATS, LNGS, jobs=1)
+        parallel = ranker.rank(inputs, LATS, LNGS, jobs=2)
+        assert parallel == serial
+        assert [r['score'] for r in serial] == sorted((r['score'] for r in serial),
+                                                      reverse=True)
+
+    def test_planet_filter(self, ranker, chart):
+        venus = ranker.inputs(chart, jd_start=JD_START, planets={'Venus'})
+        assert {sp[0] for sp in venus.line_specs} == {'Venus'}
+        assert all('Venus' in (p[0], p[2]) for p in venus.parans)
+        assert [name for name, _ in venus.planets] == ['Venus']
+
+
+class TestParseGazetteer:
+
+    def test_plain_tsv_with_header(self, astro_module, tmp_path):
+        path = tmp_path / "cities.tsv"
+        path.write_text("name\tlat\tlng\n# comment\nPrague\t50.0755\t14.4378\n\n"
+                        "São Paulo\t-23.55\t-46.63\textra\n", encoding='utf-8')
+        lats, lngs, names = astro_module.parse_gazetteer(str(path))
+        assert names == ['Prague', 'São Paulo']
+        assert lats == [50.0755, -23.55] and lngs == [14.4378, -46.63]
+
+    def test_geonames_dump(self, astro_module, tmp_path):
+        fields = ['3067696', 'Prague', 'Prague', 'Praha,Prag', '50.08804', '14.42076',
+                  'P', 'PPLC', 'CZ', '', '52', '', '', '', '1165581']
+        path = tmp_path / "cities15000.txt"
+        path.write_text("\t".join(fields) + "\n", encoding='utf-8')
+        assert astro_module.parse_gazetteer(str(path)) == (
+            [50.08804], [14.42076], ['Prague'])
+
+    def test_time_zones(self, astro_module, tmp_path):
+        path = tmp_path / "cities.tsv"
+        path.write_text("Prague\t50.0755\t14.4378\tEurope/Prague\nNowhere\t0\t0\n")
+        assert astro_module.parse_gazetteer(str(path), with_tz=True)[3] == \
+            ['Europe/Prague', None]
+
+    def test_bad_line(self, astro_module, tmp_path):
+        path = tmp_path / "cities.tsv"
+        path.write_text("Prague\t50.0755\t14.4378\nOops\tnorth\n")
+        with pytest.raises(ValueError, match=':2:'):
+            astro_module.parse_gazetteer(str(path))
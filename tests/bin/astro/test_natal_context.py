@@ -0,0 +1,95 @@
+"""Tests for NatalContext — the per-process natal chart cache.
+
+Every calculator used to re-cast the natal subject and re-extract cusps on
+each call. `TransitCalculator.natal_context` builds it once per birth data
+(keyed by a content hash) and every calculator reads from it.
+"""
+
+from dataclasses import replace
+
+import pytest
+
+
+def _sorted_walk(pos, natal_cusps):
+    """The pre-bisect `_planet_in_natal_house` algorithm, kept as reference."""
+    pos = pos % 360
+    sorted_houses = sorted(natal_cusps.items(), key=lambda x: x[1])
+    for i, (house_num, cusp_deg) in enumerate(sorted_houses):
+        _next_num, next_cusp_deg = sorted_houses[(i + 1) % 12]
+        if next_cusp_deg < cusp_deg:
+            if pos >= cusp_deg or pos < next_cusp_deg:
+                return str(house_num)
+        elif cusp_deg <= pos < next_cusp_deg:
+            return str(house_num)
+    return '1'
+
+
+class TestHouseCusps:
+
+    def test_bisect_matches_sorted_walk(self, astro_module, natal_cusps):
+        """Every 0.25° of the zodiac, plus each cusp exactly and just below it."""
+        assert isinstance(natal_cusps, astro_module.HouseCusps)
+        probes = [k * 0.25 for k in range(1440)]
+        for cusp in natal_cusps.values():
+            probes += [cusp, cusp - 1e-9, cusp + 360.0]
+        for pos in probes:
+            assert natal_cusps.house_of(pos) == _sorted_walk(pos, natal_cusps), pos
+
+    def test_plain_dict_still_accepted(self, transit_calc, natal_cusps):
+        plain = dict(natal_cusps)
+        for pos in (0.0, 123.4, 359.9):
+            assert transit_calc._planet_in_natal_house(pos, plain) == \
+                   natal_cusps.house_of(pos)
+
+
+class TestNatalContextCache:
+
+    @pytest.fixture
+    def fresh(self, astro_module, monkeypatch):
+        monkeypatch.setattr(astro_module, '_NATAL_CONTEXTS', {})
+
+    def _chart(self, astro_module, birth_data, name):
+        return astro_module.NatalChart(name=name, birth_data=replace(birth_data),
+                                       created_at="2026-01-01T00:00:00")
+
+    def test_built_once_per_birth_data(self, astro_module, transit_calc, birth_data,
+                                       fresh, monkeypatch):
+        """Two charts with identical birth data share one context; the natal
+        subject is cast once however many calculators ask."""
+        built = []
+        real = transit_calc._make_subject
+
+        def counting(name, *args):
+            built.append(name)
+            return real(name, *args)
+
+        monkeypatch.setattr(transit_calc, '_make_subject', counting)
+        a = self._chart(astro_module, birth_data, "ctx_a")
+        b = self._chart(astro_module, birth_data, "ctx_b")
+        ctx = transit_calc.natal_context(a)
+        assert transit_calc.natal_context(b) is ctx
+
+        astro_module.ParanCalculator(transit_calc).parans_near(a, 50.0)
+        rc = astro_module.RelocationCalculator(transit_calc.storage, transit_calc)
+        astro_module.AspectLineCalculator(transit_calc, rc).lines_near(a, 50.0, 14.4)
+        transit_calc.current_position(a, 'saturn')
+        assert built.count(birth_data.full_name) == 1
+
+    def test_different_birth_data_gets_own_context(self, astro_module, transit_calc,
+                                                   birth_data, fresh):
+        a = self._chart(astro_module, birth_data, "ctx_a")
+        b = self._chart(astro_module, replace(birth_data, minute=15), "ctx_b")
+        assert transit_calc.natal_context(a) is not transit_calc.natal_context(b)
+
+    def test_contents_match_subject(self, astro_module, transit_calc, birth_data,
+                                    natal_subject, natal_cusps, fresh):
+        ctx = transit_calc.natal_context(self._chart(astro_module, birth_data, "ctx"))
+        assert ctx.jd == pytest.approx(natal_subject.julian_day)
+        assert dict(ctx.cusps) == pytest.approx(dict(natal_cusps))
+        model = natal_subject.model()
+        for name, lon, (sign, house) in zip(ctx.point_names, ctx.lons, ctx.positions):
+            point = getattr(model, name.lower())
+            assert lon == pytest.approx(point.abs_pos)
+            assert (sign, house) == transit_calc._get_planet_position(natal_subject, name)
+        names = [row[0] for row in ctx.equatorial]
+        assert names == [name for name, _ in astro_module._LINE_PLANETS]
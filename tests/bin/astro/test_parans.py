@@ -16,6 +16,7 @@ exclusion near circumpolar boundaries, wrap-discontinuity guard, and a
 synthetic known-root bisection.
 """
 
+import numpy as np
 import pytest
 
 
@@ -263,3 +264,41 @@ class TestParanSolver:
             assert 'Chiron' not in (r['planet_a'], r['planet_b']), (
                 f"Chiron row leaked through include_chiron=False: {r}"
             )
+
+
+class TestParanBatchSolver:
+    """The whole-chart solve runs every combination in one grid."""
+
+    def test_batch_matches_one_at_a_time(self, astro_module, transit_calc):
+        pcalc = astro_module.ParanCalculator(transit_calc)
+        rng = np.random.default_rng(3)
+        n = 40
+        ra_a, ra_b = rng.uniform(0, 360, n), rng.uniform(0, 360, n)
+        dec_a, dec_b = rng.uniform(-28, 28, n), rng.uniform(-28, 28, n)
+        ang_a = rng.choice(pcalc.ANGLES, n).tolist()
+        ang_b = rng.choice(pcalc.ANGLES, n).tolist()
+        batch = pcalc._solve_parans(ra_a, dec_a, ang_a, ra_b, dec_b, ang_b, -89.0, 89.0)
+        for c in range(n):
+            single = pcalc._find_paran_roots(ra_a[c], dec_a[c], ang_a[c],
+                                             ra_b[c], dec_b[c], ang_b[c], -89.0, 89.0)
+            assert batch[c] == single
+
+    def test_full_globe_roots_are_parans(self, astro_module, transit_calc, birth_data):
+        """Every root of a full-globe table puts both planets on their angles
+        at the same LST, checked with the scalar `_lst_on_angle`."""
+        chart = astro_module.NatalChart(
+            name="anthony_globe", birth_data=birth_data,
+            created_at="2026-01-01T00:00:00",
+        )
+        pcalc = astro_module.ParanCalculator(transit_calc)
+        rows = pcalc.parans_near(chart, 0.0, max_delta_lat=90)
+        assert len(rows) > 200
+        eq = {name: (ra, dec) for name, _lon, ra, dec in
+              transit_calc.natal_context(chart).equatorial}
+        ParanC = astro_module.ParanCalculator
+        for r in rows:
+            lst_a = ParanC._lst_on_angle(*eq[r['planet_a']], r['angle_a'], r['paran_lat'])
+            lst_b = ParanC._lst_on_angle(*eq[r['planet_b']], r['angle_b'], r['paran_lat'])
+            if lst_a is None or lst_b is None:
+                continue   # midpoint of a bracket cut short at a circumpolar limit
+            assert abs(ParanC._wrap_signed(lst_a - lst_b)) < 0.1, r
@@ -0,0 +1,85 @@
+"""Tests for `astro --profile` (stage-level timing).
+
+A profiled command prints exactly what it would unprofiled, then a breakdown
+of wall time and call counts per stage (subject construction, swisseph,
+cache reads/writes, exact-time search, formatting...) on stderr, or as JSON.
+"""
+
+import builtins
+import json
+import time
+
+import pytest
+
+
+@pytest.fixture
+def home(astro_module, birth_data, tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path))
+    monkeypatch.delenv('ASTRO_PROFILE', raising=False)
+    astro_module.AstroStorage().save_chart(
+        astro_module.NatalChart('default', birth_data, '2026-01-01T00:00:00'))
+    return tmp_path
+
+
+FORECAST = ['forecast', '--date', '2026-01-01', '--days', '3']
+
+
+class TestProfileFlag:
+
+    def test_output_unchanged_breakdown_on_stderr(self, astro_module, home, capsys):
+        astro_module.main(FORECAST)
+        plain = capsys.readouterr()
+        astro_module.main(['--profile', *FORECAST])
+        profiled = capsys.readouterr()
+        assert profiled.out == plain.out
+        report = profiled.err[len(plain.err):]
+        assert report.startswith('profile: forecast, ')
+        for stage in ('swisseph', 'ephemeris', 'cache read', 'format', 'other'):
+            assert f"\n  {stage} " in report
+
+    def test_json_adds_up(self, astro_module, home, tmp_path):
+        path = tmp_path / "profile.json"
+        astro_module.main(['--profile-json', str(path), *FORECAST])
+        report = json.loads(path.read_text())
+        assert report['command'] == 'forecast'
+        assert report['stages']['swisseph']['calls'] > 0
+        own = sum(s['self_ms'] for s in report['stages'].values())
+        assert own + report['other_ms'] == pytest.approx(report['wall_ms'], abs=0.01)
+
+    def test_env_var(self, astro_module, home, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv('ASTRO_PROFILE', '1')
+        astro_module.main(['config'])
+        assert 'profile: config, ' in capsys.readouterr().err
+        path = tmp_path / "env.json"
+        monkeypatch.setenv('ASTRO_PROFILE', str(path))
+        astro_module.main(['config'])
+        assert json.loads(path.read_text())['command'] == 'config'
+
+    def test_reports_and_unwraps_on_error(self, astro_module, home, capsys):
+        import swisseph
+        calc_ut, real_import = swisseph.calc_ut, builtins.__import__
+        with pytest.raises(SystemExit):
+            astro_module.main(['--profile', 'show-chart', 'nosuch'])
+        assert 'profile: show-chart, ' in capsys.readouterr().err
+        assert swisseph.calc_ut is calc_ut and builtins.__import__ is real_import
+        assert astro_module._PROFILE is None
+
+
+class TestStages:
+
+    def test_nested_self_time(self, astro_module):
+        prof = astro_module._Profile()
+        try:
+            prof.enter('outer')
+            prof.enter('inner')
+            time.sleep(0.02)
+            prof.exit()
+            prof.enter('outer')      # re-entered: counted once
+            prof.exit()
+            prof.exit()
+        finally:
+            prof.close()
+        calls, total, own = prof.stats['outer']
+        assert calls == 1
+        assert own < 0.01 <= 0.02 <= total
+        assert prof.stats['inner'][0] == 1
@@ -0,0 +1,64 @@
+"""Tests for the batched progressions timeline (`astro progressions --from/--to`).
+
+The whole date list goes to astro-progressions-helper in one request and
+comes back as a stream, one progressed chart per date. immanuel isn't
+needed here: the helper stream is stubbed.
+"""
+
+from datetime import datetime
+
+import pytest
+
+
+class TestStepDates:
+
+    def test_years_keep_day_and_clamp(self, astro_module):
+        dates = astro_module.step_dates(datetime(2024, 2, 29), datetime(2028, 3, 1), '1y')
+        assert [d.strftime('%Y-%m-%d') for d in dates] == [
+            '2024-02-29', '2025-02-28', '2026-02-28', '2027-02-28', '2028-02-29']
+
+    def test_months_and_days(self, astro_module):
+        months = astro_module.step_dates(datetime(2026, 1, 31), datetime(2026, 6, 30), '2m')
+        assert [d.strftime('%m-%d') for d in months] == ['01-31', '03-31', '05-31']
+        weeks = astro_module.step_dates(datetime(2026, 1, 1), datetime(2026, 1, 29), '2w')
+        assert [d.day for d in weeks] == [1, 15, 29]
+
+    @pytest.mark.parametrize("step", ['0y', 'y', '3q', '1.5m'])
+    def test_invalid_step(self, astro_module, step):
+        with pytest.raises(ValueError, match='Invalid step'):
+            astro_module.step_dates(datetime(2026, 1, 1), datetime(2027, 1, 1), step)
+
+
+class TestProgressedTimeline:
+
+    def test_one_request_many_dates(self, astro_module, transit_calc, birth_data,
+                                    monkeypatch):
+        chart = astro_module.NatalChart(
+            name="anthony_prog_timeline", birth_data=birth_data,
+            created_at="2026-01-01T00:00:00",
+        )
+        requests = []
+
+        def fake_stream(helper, payload):
+            requests.append(payload)
+            for target in payload['targets']:
+                yield {'target': target,
+                       'planets': [{'name': 'Moon', 'sign': 'Gem', 'sign_full': 'Gemini',
+                                    'house': 9, 'longitude': 64.0, 'degree_in_sign': 4.0}],
+                       'aspects': [{'progressed_planet': 'Moon', 'natal_planet': 'Venus',
+                                    'aspect': 'trine', 'orb': 0.4}]}
+
+        monkeypatch.setattr(astro_module, '_stream_helper', fake_stream)
+        calc = astro_module.ProgressionCalculator(transit_calc.storage)
+        targets = astro_module.step_dates(datetime(2026, 1, 1), datetime(2030, 1, 1), '1y')
+        rows = list(calc.progressed_timeline(chart, targets, include_aspects=True))
+
+        assert len(requests) == 1
+        assert requests[0]['command'] == 'progressed_timeline'
+        assert requests[0]['targets'] == [t.strftime('%Y-%m-%d %H:%M') for t in targets]
+        assert [r[0] for r in rows] == targets
+        target, planets, aspects = rows[0]
+        assert planets[0] == astro_module.ProgressedPlanet(
+            name='Moon', sign='Gem', sign_full='Gemini', house=9,
+            longitude=64.0, degree_in_sign=4.0)
+        assert aspects[0].natal_planet == 'Venus'
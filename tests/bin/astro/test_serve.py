@@ -0,0 +1,135 @@
+"""Tests for `astro serve` and the CLI's forwarding to it.
+
+While a server for this version of the script listens, `astro ARGS` sends
+argv there and prints the reply instead of importing numpy/swisseph and
+loading everything again. A forwarded command must print and exit exactly
+as it would in-process.
+"""
+
+import contextlib
+import io
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def short_dir():
+    # AF_UNIX paths are limited to ~104 bytes; pytest's tmp_path can exceed it
+    with tempfile.TemporaryDirectory(dir='/tmp') as d:
+        yield Path(d)
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path))
+    monkeypatch.delenv('ASTRO_SERVER', raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def server(astro_module, short_dir, home, monkeypatch):
+    monkeypatch.setattr(astro_module, '_HELPER_STATE_DIR', short_dir)
+    sock = astro_module._helper_socket(Path(astro_module.__file__))
+    thread = threading.Thread(target=astro_module.serve, args=(sock, 0.5), daemon=True)
+    thread.start()
+    for _ in range(500):
+        if sock.exists():
+            break
+        time.sleep(0.01)
+    yield sock
+    thread.join(timeout=5)
+
+
+def _in_process(astro_module, argv):
+    out, err = io.StringIO(), io.StringIO()
+    status = 0
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            astro_module.main(argv)
+        except SystemExit as e:
+            status = e.code
+    return out.getvalue(), err.getvalue(), status
+
+
+class TestForwarding:
+
+    @pytest.mark.parametrize("argv", [
+        ['config'],
+        ['list-charts'],
+        ['show-chart', 'nosuch'],     # Error: ... exit 1
+        ['bogus'],                    # argparse usage error, exit 2
+    ])
+    def test_same_output_and_status(self, astro_module, server, capsys, argv):
+        want = _in_process(astro_module, argv)
+        status = astro_module._forward_to_server(argv)
+        got = capsys.readouterr()
+        assert (got.out, got.err, status) == want
+
+    def test_runs_in_callers_directory(self, astro_module, server, birth_data,
+                                       tmp_path, monkeypatch, capsys):
+        astro_module.AstroStorage().save_chart(
+            astro_module.NatalChart('default', birth_data, '2026-01-01T00:00:00'))
+        (tmp_path / "cities.tsv").write_text("Prague\t50.0755\t14.4378\nOops\tnorth\n")
+        monkeypatch.chdir(tmp_path)
+        assert astro_module._forward_to_server(
+            ['relocate', 'rank', '--gazetteer', 'cities.tsv']) == 1
+        assert 'cities.tsv:2:' in capsys.readouterr().err
+
+    @pytest.mark.parametrize("line", [
+        b'{"argv": ["config"]}\n',     # client hangs up before the reply
+        b'not json\n',
+        b'[1, 2]\n',
+    ])
+    def test_bad_client_keeps_server_up(self, astro_module, server, capsys, line):
+        want = _in_process(astro_module, ['config'])
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.connect(str(server))
+            s.sendall(line)
+        assert astro_module._forward_to_server(['config']) == want[2]
+        assert capsys.readouterr().out == want[0]
+
+    def test_idle_exit_removes_socket(self, astro_module, server):
+        time.sleep(1.0)
+        assert not server.exists()
+        assert astro_module._forward_to_server(['config']) is None
+
+
+class TestRunsLocally:
+
+    def test_without_server(self, astro_module, short_dir, home, monkeypatch):
+        monkeypatch.setattr(astro_module, '_HELPER_STATE_DIR', short_dir)
+        assert astro_module._forward_to_server(['config']) is None
+
+    @pytest.mark.parametrize("argv", [
+        ['add-chart'],
+        ['serve'],
+        ['--profile', 'add-chart'],
+        ['--profile-json', 'p.json', 'add-chart'],
+        ['relocate', 'rank', '--gazetteer', '-'],
+    ])
+    def test_terminal_and_stdin_commands(self, astro_module, server, argv):
+        assert astro_module._forward_to_server(argv) is None
+
+    def test_opt_out(self, astro_module, server, monkeypatch):
+        monkeypatch.setenv('ASTRO_SERVER', '0')
+        assert astro_module._forward_to_server(['config']) is None
+
+
+class TestWarmNow:
+
+    def test_repeat_call_reuses_days_roots(self, astro_module, transit_calc,
+                                           birth_data, monkeypatch):
+        chart = astro_module.NatalChart('anthony_serve', birth_data, '2026-01-01T00:00:00')
+        first = transit_calc.compute_current_transits(chart)
+        roots = []
+        real = astro_module._bracketed_root
+        monkeypatch.setattr(astro_module, '_bracketed_root',
+                            lambda *a, **k: roots.append(a) or real(*a, **k))
+        again = transit_calc.compute_current_transits(chart)
+        assert [e.exact_date for e in again] == [e.exact_date for e in first]
+        assert any(e.exact_date for e in again) and roots == []
@@ -6,8 +6,11 @@ Covers:
   - Destination tz_str (not natal!) drives SR house cusps
   - Past-year support
   - Bisection bracket holds for chart with Sun near 0° Aries (wrap-edge)
+  - Series (--years / --locations) casts the same charts as compute()
 """
 
+import pytest
+
 
 # =============================================================================
 # Self-consistency: SR returns Sun to natal Sun longitude
@@ -143,3 +146,44 @@ class TestSolarReturnBisection:
         )
         # SR should be approx 5 years after natal — sanity check
         assert abs(sr_jd - natal_jd - 5 * 365.2422) < 30.0  # ±30 days
+
+
+# =============================================================================
+# Series: many years × many locations
+# =============================================================================
+
+class TestSolarReturnSeries:
+
+    def test_find_sr_jds_matches_one_at_a_time(self, astro_module, natal_subject):
+        calc = astro_module.SolarReturnCalculator
+        natal_jd, natal_sun = natal_subject.julian_day, natal_subject.sun.abs_pos
+        offsets = [40, 33, 34, 35, 0, 36]
+        jds = calc.find_sr_jds(natal_jd, natal_sun, offsets)
+        for offset, jd in zip(offsets, jds):
+            assert abs(jd - calc.find_sr_jd(natal_jd, natal_sun, offset)) < 1e-4
+
+    def test_series_matches_compute(self, astro_module, transit_calc, birth_data):
+        chart = astro_module.NatalChart("anthony_sr_series", birth_data,
+                                        "2026-01-01T00:00:00")
+        srcalc = astro_module.SolarReturnCalculator(transit_calc)
+        locations = [(50.0875, 14.4214, 'Europe/Prague'),
+                     (-33.87, 151.21, 'Australia/Sydney')]
+        rows = srcalc.series(chart, [2026, 2027, 2031],
+                             [loc[0] for loc in locations], [loc[1] for loc in locations],
+                             ['Prague', 'Sydney'], [loc[2] for loc in locations])
+        assert [(r['target_year'], r['name']) for r in rows] == [
+            (y, n) for y in (2026, 2027, 2031) for n in ('Prague', 'Sydney')]
+        for r in rows:
+            sr = srcalc.compute(chart, r['lat'], r['lng'], r['tz_str'], r['target_year'])
+            assert r['sr_jd'] == sr['sr_jd']
+            assert r['sr_local_iso'] == sr['sr_local_iso']
+            for code, lon in sr['angles'].items():
+                assert abs(((r['angles'][code] - lon + 180) % 360) - 180) < 1e-6
+            assert r['houses'] == {p['name']: p['house'] for p in sr['planets']}
+
+    def test_parse_year_range(self, astro_module):
+        assert astro_module.parse_year_range('2026..2028') == [2026, 2027, 2028]
+        assert astro_module.parse_year_range('2030') == [2030]
+        for bad in ('2030..2026', '2026-2030', 'soon'):
+            with pytest.raises(ValueError):
+                astro_module.parse_year_range(bad)
@@ -0,0 +1,93 @@
+"""Tests for the SQLite transit cache on AstroStorage.
+
+One file, one table per chart, one row per day. Rows carry the key they
+were computed under (birth data + orb settings), so editing either makes
+them read as misses instead of serving stale aspects.
+"""
+
+from dataclasses import replace
+from datetime import datetime
+
+import pytest
+
+
+@pytest.fixture
+def storage(astro_module, tmp_path):
+    return astro_module.AstroStorage(base_path=tmp_path)
+
+
+@pytest.fixture
+def chart(astro_module, birth_data):
+    return astro_module.NatalChart(
+        name='anthony_test_store', birth_data=birth_data,
+        created_at='2026-01-01T00:00:00',
+    )
+
+
+def _event(astro_module, planet='Saturn', orb=0.4):
+    return astro_module.TransitEvent(
+        transit_planet=planet, natal_planet='Sun', aspect='trine', orb=orb,
+        transit_sign='Pis', transit_house='5', natal_sign='Lib', natal_house='8',
+        applying=True, exact_date=None,
+    )
+
+
+class TestTransitStore:
+
+    def test_round_trip_and_range(self, astro_module, storage, chart):
+        storage.cache_transits(chart, {
+            '2026-05-01': [_event(astro_module)],
+            '2026-05-02': [],
+            '2026-05-03': [_event(astro_module, 'Mars', -1.2)],
+        })
+        got = storage.get_range(chart, '2026-05-02', '2026-05-10')
+        assert sorted(got) == ['2026-05-02', '2026-05-03']
+        assert got['2026-05-02'] == []
+        assert astro_module.TransitEvent(**got['2026-05-03'][0]) == _event(astro_module, 'Mars', -1.2)
+
+    def test_charts_do_not_share_rows(self, astro_module, storage, chart):
+        storage.cache_transits(chart, {'2026-05-01': [_event(astro_module)]})
+        other = replace(chart, name='someone "else"')
+        assert storage.get_range(other, '2026-05-01', '2026-05-01') == {}
+
+    def test_birth_data_edit_invalidates(self, astro_module, storage, chart):
+        storage.cache_transits(chart, {'2026-05-01': [_event(astro_module)]})
+        edited = replace(chart, birth_data=replace(chart.birth_data, minute=15))
+        assert storage.get_range(edited, '2026-05-01', '2026-05-01') == {}
+        assert storage.get_range(chart, '2026-05-01', '2026-05-01')
+
+    def test_orb_change_invalidates(self, astro_module, storage, chart):
+        storage.cache_transits(chart, {'2026-05-01': [_event(astro_module)]})
+        config = storage.load_config()
+        config.orb_settings['trine'] = config.orb_settings.get('trine', 8) + 1
+        storage.save_config(config)
+        assert storage.get_range(chart, '2026-05-01', '2026-05-01') == {}
+
+    def test_clear_cache_drops_rows(self, astro_module, storage, chart):
+        storage.cache_transits(chart, {
+            '2026-05-01': [_event(astro_module)],
+            '2026-05-02': [],
+        })
+        assert storage.clear_cache() == 2
+        assert storage.get_range(chart, '2026-05-01', '2026-05-02') == {}
+        assert storage.clear_cache() == 0
+
+
+class TestForecastUsesStore:
+
+    def test_warm_forecast_reads_once_and_matches(self, astro_module, storage, chart,
+                                                  monkeypatch):
+        calc = astro_module.TransitCalculator(storage)
+        start = datetime(2026, 5, 4)
+        writes = []
+        real = storage.cache_transits
+        monkeypatch.setattr(storage, 'cache_transits',
+                            lambda c, days: (writes.append(len(days)), real(c, days)))
+
+        cold = calc.forecast_transits(chart, days=30, start_date=start)
+        assert writes == [30]
+
+        calc._table_transits = lambda *a, **k: pytest.fail('warm run recomputed aspects')
+        warm = calc.forecast_transits(chart, days=30, start_date=start)
+        assert writes == [30, 0]
+        assert warm == cold
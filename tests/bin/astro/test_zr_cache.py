@@ -0,0 +1,120 @@
+"""Tests for the ZR period cache (ZRCalculator.periods).
+
+The helper computes a chart's whole L1-L4 tree once; AstroStorage keeps it
+under a hash of birth data, lot, depth, lifespan and the helper script, and
+timelines and age snapshots are answered from it while the helper still
+runs the stellium build that computed it. stellium isn't needed
+here: `_run_helper` is replaced by a canned tree.
+"""
+
+from dataclasses import replace
+
+import pytest
+
+# Two L1 periods, each split in two at L2 (dates as the helper prints them)
+TREE = {'levels': {
+    '1': [
+        {'level': 1, 'sign': 'Taurus', 'ruler': 'Venus',
+         'start': '1993-10-20', 'end': '2001-09-08'},
+        {'level': 1, 'sign': 'Gemini', 'ruler': 'Mercury',
+         'start': '2001-09-08', 'end': '2021-05-26'},
+    ],
+    '2': [
+        {'level': 2, 'sign': 'Taurus', 'ruler': 'Venus',
+         'start': '1993-10-20', 'end': '1994-06-17'},
+        {'level': 2, 'sign': 'Gemini', 'ruler': 'Mercury',
+         'start': '1994-06-17', 'end': '2001-09-08'},
+        {'level': 2, 'sign': 'Gemini', 'ruler': 'Mercury',
+         'start': '2001-09-08', 'end': '2003-05-01'},
+        {'level': 2, 'sign': 'Cancer', 'ruler': 'Moon',
+         'start': '2003-05-01', 'end': '2021-05-26'},
+    ],
+}}
+
+
+@pytest.fixture
+def storage(astro_module, tmp_path):
+    return astro_module.AstroStorage(base_path=tmp_path)
+
+
+@pytest.fixture
+def chart(astro_module, birth_data):
+    return astro_module.NatalChart(
+        name='anthony_zr_cache', birth_data=birth_data,
+        created_at='2026-01-01T00:00:00',
+    )
+
+
+ENGINE = {'stellium': '0.18.1', 'commit': 'abc123'}
+
+
+@pytest.fixture
+def engine():
+    return dict(ENGINE)
+
+
+@pytest.fixture
+def calls(astro_module, monkeypatch, engine):
+    calls = []
+
+    def fake_run_helper(name, payload):
+        calls.append(payload)
+        if payload['command'] == 'engine':
+            return dict(engine)
+        return {**TREE, 'engine': dict(engine)}
+
+    monkeypatch.setattr(astro_module, '_run_helper', fake_run_helper)
+    return calls
+
+
+class TestZRCache:
+
+    def test_one_helper_call_across_processes(self, astro_module, storage, chart, calls):
+        zr = astro_module.ZRCalculator(storage)
+        l1 = zr.timeline(chart, 'fortune', level=1, max_level=2)
+        assert [p.sign for p in l1] == ['Taurus', 'Gemini']
+        assert len(zr.timeline(chart, 'fortune', level=2, max_level=2)) == 4
+        assert [c['command'] for c in calls] == ['periods']
+        assert calls[0]['lot'] == 'Part of Fortune'
+
+        # A fresh calculator (next astro run) reads the file, once it has
+        # checked the helper still runs the same stellium
+        again = astro_module.ZRCalculator(storage)
+        assert again.timeline(chart, 'fortune', level=1, max_level=2) == l1
+        assert [c['command'] for c in calls] == ['periods', 'engine']
+
+    def test_other_stellium_build_is_a_miss(self, astro_module, storage, chart,
+                                            calls, engine):
+        astro_module.ZRCalculator(storage).timeline(chart, 'fortune', max_level=2)
+        engine['commit'] = 'def456'
+        astro_module.ZRCalculator(storage).timeline(chart, 'fortune', max_level=2)
+        assert [c['command'] for c in calls] == ['periods', 'engine', 'periods']
+        # ...and the recomputed tree is what the cache holds now
+        astro_module.ZRCalculator(storage).timeline(chart, 'fortune', max_level=2)
+        assert [c['command'] for c in calls][3:] == ['engine']
+
+    def test_snapshot_is_an_interval_lookup(self, astro_module, storage, chart, calls):
+        zr = astro_module.ZRCalculator(storage)
+        snap = zr.snapshot_at_age(chart, 'fortune', 9.0, max_level=2)
+        assert snap.date == '2002-10-20'
+        assert (snap.l1.sign, snap.l2.sign) == ('Gemini', 'Gemini')
+        assert snap.l3 is None
+
+        # On a boundary date the period starting that day is active
+        boundary = zr.snapshot_at_age(chart, 'fortune', 0.0, max_level=2)
+        assert (boundary.l1.start, boundary.l2.start) == ('1993-10-20', '1993-10-20')
+        # Past the computed lifespan nothing is active
+        assert zr.snapshot_at_age(chart, 'fortune', 40.0, max_level=2).l1 is None
+        assert [c['command'] for c in calls] == ['periods']
+
+    def test_key_covers_inputs(self, astro_module, storage, chart):
+        zr = astro_module.ZRCalculator(storage)
+        key = zr.periods_key(chart, 'fortune', 4, 100)
+        assert zr.periods_key(chart, 'Part of Fortune', 4, 100) == key
+        edited = replace(chart, birth_data=replace(chart.birth_data, minute=15))
+        assert zr.periods_key(edited, 'fortune', 4, 100) != key
+        assert zr.periods_key(chart, 'spirit', 4, 100) != key
+        assert zr.periods_key(chart, 'fortune', 3, 100) != key
+        assert zr.periods_key(chart, 'fortune', 4, 90) != key
+        # Renaming the chart doesn't matter, only its data
+        assert zr.periods_key(replace(chart, name='other'), 'fortune', 4, 100) == key
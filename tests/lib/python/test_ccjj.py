@@ -146,6 +146,30 @@ def test_diff_previews_without_committing(repo):
     assert repo.show("f.txt") == b"a\n"          # nothing committed
 
 
+def test_jj_calls_do_not_grow_with_file_count(repo, tmp_path):
+    """Build, preview and verify each ran one `jj file show` per path, so a
+    40-file commit spawned 120+ jj processes. Blobs are now read in a batch from
+    jj's git store; the CRLF and non-UTF-8 files check the batch framing."""
+    def commit_calls(sid, n):
+        names = ["%s-%d.txt" % (sid, i) for i in range(n)]
+        for name in names:
+            repo.write(name, b"a\r\n\xff\n")
+        repo.commit("base " + sid)
+        for name in names:
+            repo.write(name, b"b\r\n\xff\n")
+            repo.record(sid, name, old="a", new="b", original="a\r\n\udcff\n")
+        (tmp_path / sid).mkdir()
+        stub, log = _counting_jj(tmp_path / sid)
+        r = repo.run("commit", "-m", sid, sid=sid,
+                     env={"PATH": stub + os.pathsep + os.environ["PATH"]})
+        assert r.returncode == 0, r.stderr
+        for name in names:
+            assert repo.show(name) == b"b\r\n\xff\n"
+        return len(log.read_text().splitlines())
+
+    assert commit_calls("S1", 2) == commit_calls("S2", 12)
+
+
 # --------------------------------------------------- placement and attribution
 
 def test_patches_the_right_occurrence(repo):
@@ -477,6 +501,58 @@ def test_record_edit_writes_a_usable_record(tmp_path):
     assert repo.show("f.txt") == b"A\n"
 
 
+def _hook(repo, tool, tool_input, tool_response):
+    payload = json.dumps({"tool_name": tool, "session_id": "S1",
+                          "tool_input": tool_input, "tool_response": tool_response})
+    subprocess.run([sys.executable, CCJJ, "record-edit"], input=payload,
+                   capture_output=True, text=True,
+                   env={**os.environ, "CC_JJ_JOURNAL": repo.journal})
+
+
+def test_record_edit_stores_each_text_once(tmp_path):
+    """Records carried full-file texts inline, so every edit to a big file
+    stored it again and every journal reader parsed all of them. A Write's
+    content and the next Edit's pre-edit text are the same text: one blob."""
+    repo = Repo(str(tmp_path))
+    repo.write("seed.txt", "x\n")
+    repo.commit("base")
+    big = "".join("line %d\n" % i for i in range(5000))
+    path = os.path.join(repo.root, "f.txt")
+    _hook(repo, "Write", {"file_path": path, "content": big}, {})
+    _hook(repo, "Edit", {"file_path": path, "old_string": "line 7\n", "new_string": "LINE 7\n"},
+          {"originalFile": big, "structuredPatch": [{"lines": ["-line 7", "+LINE 7"]}]})
+    repo.write("f.txt", big.replace("line 7\n", "LINE 7\n"))
+
+    jdir = os.path.join(repo.journal, repo.root.replace("/", "_"), "S1")
+    assert len(os.listdir(os.path.join(jdir, "blobs"))) == 1
+    assert all(os.path.getsize(os.path.join(jdir, n)) < 1000 for n in repo.journal_records("S1"))
+
+    assert repo.run("commit", "-m", "hooked", sid="S1").returncode == 0
+    assert repo.show("f.txt") == big.replace("line 7\n", "LINE 7\n").encode()
+
+
+def test_damaged_blob_refuses_to_commit(tmp_path):
+    """A wrong pre-edit text places the edit wrongly, and the byte verification
+    only checks that the payload was transcribed."""
+    repo = Repo(str(tmp_path))
+    repo.write("f.txt", "a\n")
+    repo.commit("base")
+    repo.write("f.txt", "A\n")
+    _hook(repo, "Edit", {"file_path": os.path.join(repo.root, "f.txt"),
+                         "old_string": "a", "new_string": "A"},
+          {"originalFile": "a\n", "structuredPatch": [{"lines": ["-a", "+A"]}]})
+    blobs = os.path.join(repo.journal, repo.root.replace("/", "_"), "S1", "blobs")
+    (name,) = os.listdir(blobs)
+    with open(os.path.join(blobs, name), "wb") as fh:
+        fh.write(b"not zlib")
+
+    r = repo.run("commit", "-m", "hooked", sid="S1")
+    assert r.returncode == 1
+    assert "blob" in r.stderr
+    assert repo.show("f.txt") == b"a\n"
+    assert repo.journal_records("S1")
+
+
 # ---------------------------------------------------------------- liveness
 
 def _owner(repo, sid, pid, lstart):